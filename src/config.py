@@ -31,6 +31,8 @@ TEMP_DIR: str = "/private/temp"
 """Relative path to temporary folder used to store cached media data."""
 LOG_DIR: str = "/private/logs"
 """Relative path to temporary folder used to store session logs."""
+CACHE_DIR: str = "/private/cache"
+"""Relative path to folder used to store YTDL cache data persisting between sessions."""
 CONFIG_PATH: str = "/private/config-blueberry.json"
 """Relative path to data file used for bot configuration."""
 STRINGS_PATH = "/jukebox/assets/strings.json"
@@ -148,6 +150,13 @@ LYRICS_VERBOSE: bool = cfg["lyrics"]["verbose"]
 
 # DB
 
+DB_WRITE_BATCH_SIZE: int = 50
+"""Maximum number of queued user updates written to the database in a single transaction."""
+DB_WRITE_INTERVAL_SECONDS: float = 0.5
+"""Duration in seconds to gather queued user updates before writing them to the database."""
+DB_USER_CACHE_SIZE: int = 1024
+"""Maximum number of user entries kept in memory to serve repeated reads."""
+
 # Packages
 
 PACKAGE_CHECKS: List[str] = cfg["packages"]["check"]
@@ -161,6 +170,18 @@ YTDL_OPTIONS: dict = cfg["ytdl"]["options"]
 """Flags and values for YTDL connection process."""
 YTDL_AMBIGUOUS_ATTEMPTS: int = cfg["ytdl"]["ambiguous_attempts"]
 YTDL_AMBIGUOUS_RESULTS: int = cfg["ytdl"]["ambiguous_results"]
+YTDL_WORKERS: int = 4
+"""Maximum number of threads used to run YTDL extractions and downloads concurrently."""
+YTDL_DNS_CACHE_SIZE: int = 256
+"""Maximum number of host lookups made by YTDL kept in memory."""
+YTDL_DNS_CACHE_TTL_SECONDS: int = 300
+"""Duration in seconds before host lookups made by YTDL expire, or 0 to disable caching lookups.
+Caching replaces socket.getaddrinfo for the whole process, but only applies to lookups from YTDL executor threads."""
+YTDL_CACHE_SIZE: int = 256
+"""Maximum number of query results kept in memory to skip repeated extractions."""
+YTDL_CACHE_TTL_SECONDS: int = 600
+"""Duration in seconds before cached query results expire, kept short as streaming URLs expire."""
 
 YTDL_OPTIONS["outtmpl"] = os.path.join(TEMP_DIR, YTDL_OPTIONS["outtmpl"])
+YTDL_OPTIONS.setdefault("cachedir", CACHE_DIR)
 yt_dlp.utils.bug_reports_message = lambda: ""
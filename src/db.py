@@ -8,38 +8,39 @@ Contents:
     Data models
         DBUser
     Constant values
+    Connection
     Utility methods
+    Write queue
     Data queries
 """
 
+import asyncio
+import atexit
+import concurrent.futures
+import copy
 import sqlite3
+from collections import OrderedDict
+from dataclasses import dataclass
 from sqlite3 import Connection
-from typing import Tuple, Optional, List
+from typing import Tuple, Optional, List, Dict, Set, Iterable, Callable, Any
 
-from config import DATABASE_PATH
+import err
+from config import DATABASE_PATH, DB_WRITE_BATCH_SIZE, DB_WRITE_INTERVAL_SECONDS, DB_USER_CACHE_SIZE
 
 
 # Data models
 
 
+@dataclass
 class DBUser:
+    # Slots are declared by hand as dataclass(slots=True) requires Python 3.10
+    __slots__ = ("user_id", "tracks_added", "tracks_listened", "duration_listened")
+
     user_id: int
     tracks_added: int
     tracks_listened: int
     duration_listened: int
 
-    def __init__(
-            self,
-            user_id: int,
-            tracks_added: int,
-            tracks_listened: int,
-            duration_listened: int
-    ):
-        self.user_id = user_id
-        self.tracks_added = tracks_added
-        self.tracks_listened = tracks_listened
-        self.duration_listened = duration_listened
-
 
 # Constant values
 
@@ -49,20 +50,84 @@ KEY_USER_ID: str = "ID"
 KEY_TRACKS_ADDED: str = "TRACKS_ADDED"
 KEY_TRACKS_LISTENED: str = "TRACKS_LISTENED"
 KEY_DURATION_LISTENED: str = "DURATION_LISTENED"
+INDEX_USERS_DURATION_LISTENED: str = "IDX_USERS_DURATION_LISTENED"
 
 TABLE_GUILDS: str = "GUILDS"
 KEY_GUILD_ID: str = "ID"
 KEY_RULES_MESSAGE_IDS: str = "RULES_MESSAGE_IDS"
 
+QUERY_GET_RULES_MESSAGE_IDS: str = "SELECT {0} FROM {1} WHERE {2}=?".format(
+    KEY_RULES_MESSAGE_IDS,
+    TABLE_GUILDS,
+    KEY_GUILD_ID)
+QUERY_SET_RULES_MESSAGE_IDS: str = (
+    "INSERT INTO {0} ({1}, {2}) VALUES (?, ?)"
+    " ON CONFLICT({1}) DO UPDATE SET {2}=excluded.{2}").format(
+    TABLE_GUILDS,
+    KEY_GUILD_ID,
+    KEY_RULES_MESSAGE_IDS)
+QUERY_GET_USER: str = "SELECT * FROM {0} WHERE {1} = ?".format(
+    TABLE_USERS,
+    KEY_USER_ID)
+QUERY_ADD_USER: str = "INSERT OR IGNORE INTO {0} ({1}, {2}, {3}, {4}) VALUES (?, 0, 0, 0)".format(
+    TABLE_USERS,
+    KEY_USER_ID,
+    KEY_TRACKS_ADDED,
+    KEY_TRACKS_LISTENED,
+    KEY_DURATION_LISTENED)
+QUERY_INCREMENT_USER: str = "UPDATE {0} SET {2}={2}+?, {3}={3}+?, {4}={4}+? WHERE {1}=?".format(
+    TABLE_USERS,
+    KEY_USER_ID,
+    KEY_TRACKS_ADDED,
+    KEY_TRACKS_LISTENED,
+    KEY_DURATION_LISTENED)
+QUERY_GET_TOP_USERS: str = "SELECT * FROM {0} ORDER BY {1} DESC LIMIT ?".format(
+    TABLE_USERS,
+    KEY_DURATION_LISTENED)
+QUERY_GET_NUM_USERS: str = "SELECT COUNT(*) FROM {0}".format(
+    TABLE_USERS)
+
+
+# Connection
+
+
+_conn: Optional[Connection] = None
+"""Database connection shared between all queries, opened on first use."""
+_executor: concurrent.futures.ThreadPoolExecutor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=1,
+    thread_name_prefix="db")
+"""Single-thread executor running all database queries from the event loop.
+The connection and all cached entries are only used from this thread, so no locking is needed."""
+
 
 # Utility methods
 
 
-def setup():
+def _get_connection() -> Connection:
+    """
+    Gets the shared database connection, opening and tuning it if not yet open.
+    Callers are expected to be running on the database thread.
+    """
+    global _conn
+    if _conn is None:
+        # Connection is opened on the database thread, but closed on exit from the main thread
+        _conn = sqlite3.connect(DATABASE_PATH, check_same_thread=False, isolation_level=None,
+                                cached_statements=256)
+        _conn.execute("PRAGMA journal_mode=WAL")
+        _conn.execute("PRAGMA synchronous=NORMAL")
+        _conn.execute("PRAGMA busy_timeout=5000")
+        _conn.execute("PRAGMA cache_size=-20000")
+        atexit.register(_conn.close)
+    return _conn
+
+async def setup() -> None:
     """
     Generates database with required tables.
     """
-    db: Connection = sqlite3.connect(DATABASE_PATH)
+    await _run(_setup)
+
+def _setup() -> None:
+    db: Connection = _get_connection()
     # Guilds table
     db.execute(
         "CREATE TABLE IF NOT EXISTS {0} ({1} INT PRIMARY KEY, {2} INT)"
@@ -81,59 +146,176 @@ def setup():
             KEY_TRACKS_LISTENED,
             KEY_DURATION_LISTENED
         ))
-    db.commit()
-    db.close()
+    # Users index for listening time rankings
+    db.execute(
+        "CREATE INDEX IF NOT EXISTS {0} ON {1} ({2} DESC)"
+        .format(
+            INDEX_USERS_DURATION_LISTENED,
+            TABLE_USERS,
+            KEY_DURATION_LISTENED
+        ))
 
-def _db_read(_query: [tuple, str]) -> any:
+def _db_read(_query: [tuple, str], row_factory: Callable = None) -> any:
     """
     Helper function to perform database reads.
+    :param row_factory: Function used to create each result from its cursor and row, if not returning rows as tuples.
     """
-    sqlconn = sqlite3.connect(DATABASE_PATH)
     results: any
-    results = sqlconn.execute(*_query).fetchall()
-    sqlconn.close()
+    cursor: sqlite3.Cursor = _get_connection().execute(*_query)
+    cursor.row_factory = row_factory
+    results = cursor.fetchall()
     return results
 
+def _db_read_one(_query: [tuple, str]) -> Optional[tuple]:
+    """
+    Helper function to perform database reads expecting at most a single row.
+    """
+    result: Optional[tuple]
+    cursor: sqlite3.Cursor = _get_connection().execute(*_query)
+    result = cursor.fetchone()
+    cursor.close()
+    return result
+
 def _db_write(_query: [Tuple[str, list], str]):
     """
     Helper function to perform database writes.
     """
-    sqlconn = sqlite3.connect(DATABASE_PATH)
+    sqlconn: Connection = _get_connection()
     sqlconn.execute(*_query) if isinstance(_query, tuple) else sqlconn.execute(_query)
-    sqlconn.commit()
-    sqlconn.close()
+
+async def _run(func: Callable, *args) -> Any:
+    """
+    Helper function to run blocking database functions on the database thread.
+    """
+    return await asyncio.get_event_loop().run_in_executor(_executor, func, *args)
+
+
+# Write queue
+
+
+_write_queue: Optional[asyncio.Queue] = None
+"""Queue of user IDs with increments waiting to be written to the database, consumed by the writer task."""
+_write_loop: Optional[asyncio.AbstractEventLoop] = None
+"""Event loop running the writer task."""
+_writer_task: Optional[asyncio.Task] = None
+"""Background task writing queued user stat increments to the database in batches."""
+_num_users: Optional[int] = None
+"""Number of user entries in the database, counted on first use and kept up to date as entries are added."""
+_user_cache: OrderedDict = OrderedDict()
+"""Recently-used user entries, used to serve repeated reads without querying the database."""
+_pending: Dict[int, DBUser] = {}
+"""Increments to each user's stats not yet written to the database, used to coalesce repeated increments to a user
+and added to reads before the write lands."""
+
+
+def start_writer() -> None:
+    """
+    Starts the background task writing queued user stat increments to the database.
+    Until started, increments are written immediately.
+    """
+    global _write_queue, _write_loop, _writer_task
+    if _writer_task is None:
+        _write_queue = asyncio.Queue()
+        _write_loop = asyncio.get_event_loop()
+        _writer_task = _write_loop.create_task(_writer())
+
+async def _writer() -> None:
+    """
+    Consumes queued users, gathering them for a short interval and writing their increments in a single transaction.
+    """
+    while True:
+        user_ids: Set[int] = {await _write_queue.get()}
+        deadline: float = _write_loop.time() + DB_WRITE_INTERVAL_SECONDS
+        while len(user_ids) < DB_WRITE_BATCH_SIZE:
+            timeout: float = deadline - _write_loop.time()
+            if timeout <= 0:
+                break
+            try:
+                user_ids.add(await asyncio.wait_for(_write_queue.get(), timeout=timeout))
+            except asyncio.TimeoutError:
+                break
+        try:
+            await _run(_write_pending, user_ids)
+        except Exception as error:
+            err.log(error)
+
+async def flush() -> None:
+    """
+    Writes all pending user stat increments to the database, such as before shutting down.
+    """
+    if _writer_task is not None:
+        await _run(_write_pending)
+
+def _write_pending(user_ids: Optional[Iterable[int]] = None) -> None:
+    """
+    Adds the pending increments for a set of users to their database entries in a single transaction.
+    Increments are applied in SQL, so no entries are read first and no concurrent increments are lost.
+    :param user_ids: IDs of users to write, or None to write all pending increments.
+    """
+    increments: List[DBUser] = list(_pending.values()) if user_ids is None \
+        else [_pending[user_id] for user_id in user_ids if user_id in _pending]
+    if not increments:
+        return
+    sqlconn: Connection = _get_connection()
+    sqlconn.execute("BEGIN")
+    try:
+        # Add missing users first to count new entries
+        num_added: int = sqlconn.executemany(QUERY_ADD_USER, [[increment.user_id] for increment in increments]).rowcount
+        sqlconn.executemany(QUERY_INCREMENT_USER, [_increment_to_entry(increment) for increment in increments])
+        sqlconn.execute("COMMIT")
+    except Exception:
+        sqlconn.execute("ROLLBACK")
+        raise
+
+    _add_num_users(num_added)
+
+    # Drop pending increments once written, keeping any recently-used entries in line with the database
+    for increment in increments:
+        _pending.pop(increment.user_id)
+        cached: Optional[DBUser] = _user_cache.get(increment.user_id)
+        if cached:
+            _add_user_stats(cached, increment)
+
+def _queue_write(user_id: int) -> None:
+    """
+    Adds a user to the write queue from any thread.
+    """
+    try:
+        is_loop_thread: bool = asyncio.get_running_loop() is _write_loop
+    except RuntimeError:
+        is_loop_thread = False
+    if is_loop_thread:
+        _write_queue.put_nowait(user_id)
+    else:
+        _write_loop.call_soon_threadsafe(_write_queue.put_nowait, user_id)
 
 
 # Guild queries
 
 
-def get_rules_message_ids(guild_id: int) -> Optional[str]:
+async def get_rules_message_ids(guild_id: int) -> Optional[str]:
     """
     Gets the rules message IDs for the current guild as space-separated values in order.
     """
+    return await _run(_get_rules_message_ids, guild_id)
+
+def _get_rules_message_ids(guild_id: int) -> Optional[str]:
     query: tuple = (
-        "SELECT {0} FROM {1} WHERE {2}=?"
-        .format(
-            KEY_RULES_MESSAGE_IDS,
-            TABLE_GUILDS,
-            KEY_GUILD_ID
-        ), [
+        QUERY_GET_RULES_MESSAGE_IDS, [
             guild_id
         ])
-    result = _db_read(query)
-    return result[0][0] if result and result[0] else None
+    result: Optional[tuple] = _db_read_one(query)
+    return result[0] if result else None
 
-def set_rules_message_ids(guild_id: int, message_ids: str) -> None:
+async def set_rules_message_ids(guild_id: int, message_ids: str) -> None:
     """
     Updates a guild's rules message IDs.
     """
+    await _run(_set_rules_message_ids, guild_id, message_ids)
+
+def _set_rules_message_ids(guild_id: int, message_ids: str) -> None:
     query: tuple = (
-        "REPLACE INTO {0} ({1}, {2}) VALUES (?, ?)"
-        .format(
-            TABLE_GUILDS,
-            KEY_GUILD_ID,
-            KEY_RULES_MESSAGE_IDS
-        ), [
+        QUERY_SET_RULES_MESSAGE_IDS, [
             guild_id,
             message_ids
         ])
@@ -143,6 +325,16 @@ def set_rules_message_ids(guild_id: int, message_ids: str) -> None:
 # User queries
 
 
+def _cache_user(user: DBUser) -> None:
+    """
+    Adds a user entry to the recently-used entries, evicting the least-recently-used entry if full.
+    Callers are expected to be running on the database thread.
+    """
+    _user_cache[user.user_id] = user
+    _user_cache.move_to_end(user.user_id)
+    if len(_user_cache) > DB_USER_CACHE_SIZE:
+        _user_cache.popitem(last=False)
+
 def _entry_to_user(entry: list) -> DBUser:
     """
     Creates a DBUser instance from a database entry
@@ -154,61 +346,123 @@ def _entry_to_user(entry: list) -> DBUser:
         duration_listened=entry[3]
     )
 
-def get_user(user_id: int) -> DBUser:
+def _user_row_factory(cursor: sqlite3.Cursor, row: tuple) -> DBUser:
+    """
+    Creates a DBUser instance from a database entry as it is fetched
+    """
+    return _entry_to_user(row)
+
+def _increment_to_entry(increment: DBUser) -> list:
+    """
+    Creates increment query parameters from a DBUser instance holding amounts to add
+    """
+    return [
+        increment.tracks_added,
+        increment.tracks_listened,
+        increment.duration_listened,
+        increment.user_id
+    ]
+
+async def get_user(user_id: int) -> DBUser:
     """
     Gets the database entry for a given user.
+    Entries are read on the database thread, so the event loop never waits on the database.
     """
-    query: tuple = (
-        "SELECT * FROM {0} WHERE {1} = ?"
-        .format(
-            TABLE_USERS,
-            KEY_USER_ID
-        ), [
-            user_id
-        ])
-    entry: list = _db_read(query)
-    return _entry_to_user(entry[0] if entry and entry[0] else [user_id, 0, 0, 0])
+    return await _run(_get_user, user_id)
+
+def _get_user(user_id: int) -> DBUser:
+    # Serve recently-used entries without querying the database
+    user: Optional[DBUser] = _user_cache.get(user_id)
+    if not user:
+        cursor: sqlite3.Cursor = _get_connection().execute(QUERY_GET_USER, [user_id])
+        entry: Optional[tuple] = cursor.fetchone()
+        cursor.close()
+        user = _entry_to_user(entry) if entry else DBUser(user_id, 0, 0, 0)
+    _cache_user(user)
+    user = copy.copy(user)
+
+    # Include queued increments not yet written to the database
+    pending: Optional[DBUser] = _pending.get(user_id)
+    if pending:
+        _add_user_stats(user, pending)
+    return user
+
+async def increment_user_stats(user_id: int, tracks_added: int = 0, tracks_listened: int = 0,
+                               duration_listened: int = 0) -> None:
+    """
+    Adds to a user's stats without reading their entry first, creating the entry if none exists.
+    :param user_id: ID of user to update.
+    :param tracks_added: Number of tracks to add to the user's tracks added.
+    :param tracks_listened: Number of tracks to add to the user's tracks listened.
+    :param duration_listened: Duration in seconds to add to the user's duration listened.
+    """
+    await increment_users_stats_bulk(increments=[DBUser(user_id, tracks_added, tracks_listened, duration_listened)])
 
-def update_user(entry: DBUser) -> None:
+async def increment_users_stats_bulk(increments: List[DBUser]) -> None:
     """
-    Updates a user's database entry. Negative values will be ignored.
+    Adds to the stats for many users at once without reading their entries first, creating entries if none exist.
+    Increments are written in a single transaction, or queued and written in batches once the writer task is started.
+    :param increments: Amounts to add to each user's stats, with one entry per user.
     """
-    query: tuple = (
-        "REPLACE INTO {0} ({1}, {2}, {3}, {4}) VALUES (?, ?, ?, ?)"
-        .format(
-            TABLE_USERS,
-            KEY_USER_ID,
-            KEY_TRACKS_ADDED,
-            KEY_TRACKS_LISTENED,
-            KEY_DURATION_LISTENED,
-        ), [
-            entry.user_id,
-            entry.tracks_added,
-            entry.tracks_listened,
-            entry.duration_listened
-        ])
-    _db_write(query)
+    await _run(_increment_users_stats_bulk, [copy.copy(increment) for increment in increments])
+
+def _increment_users_stats_bulk(increments: List[DBUser]) -> None:
+    # Coalesce with any increments already queued for each user
+    queued: List[DBUser] = []
+    for increment in increments:
+        pending: Optional[DBUser] = _pending.get(increment.user_id)
+        if pending:
+            _add_user_stats(pending, increment)
+        else:
+            _pending[increment.user_id] = increment
+            queued.append(increment)
+
+    if _writer_task is None:
+        _write_pending(user_ids=[increment.user_id for increment in increments])
+        return
+
+    # Users with increments already pending are already in the write queue
+    for increment in queued:
+        _queue_write(increment.user_id)
+
+def _add_user_stats(user: DBUser, increment: DBUser) -> None:
+    """
+    Adds the stats of one entry to another in place.
+    """
+    user.tracks_added += increment.tracks_added
+    user.tracks_listened += increment.tracks_listened
+    user.duration_listened += increment.duration_listened
 
-def get_top_users(num: int) -> List[DBUser]:
+async def get_top_users(num: int) -> List[DBUser]:
+    return await _run(_get_top_users, num)
+
+def _get_top_users(num: int) -> List[DBUser]:
+    # Write pending increments so rankings include them
+    _write_pending()
     query: tuple = (
-        "SELECT * FROM {0} ORDER BY {1} DESC LIMIT {2}"
-        .format(
-            TABLE_USERS,
-            KEY_DURATION_LISTENED,
+        QUERY_GET_TOP_USERS, [
             num
-        ), [
         ])
-    entries: list = _db_read(query)
-    users: list = [_entry_to_user(entry) for entry in entries]
+    users: List[DBUser] = _db_read(query, row_factory=_user_row_factory)
     return users
 
-def get_num_users() -> int:
-    query: tuple = (
-        "SELECT COUNT({0}) FROM {1}"
-        .format(
-            KEY_USER_ID,
-            TABLE_USERS
-        ), [
-        ])
-    result: list = _db_read(query)
-    return result[0][0] if result and result[0] else 0
+async def get_num_users() -> int:
+    return await _run(_get_num_users)
+
+def _get_num_users() -> int:
+    global _num_users
+    # Write pending increments so users added by them are counted
+    _write_pending()
+    if _num_users is None:
+        result: Optional[tuple] = _get_connection().execute(QUERY_GET_NUM_USERS).fetchone()
+        _num_users = result[0] if result else 0
+    return _num_users
+
+def _add_num_users(num: int) -> None:
+    """
+    Adds newly-created entries to the user count, if counted.
+    Callers are expected to be running on the database thread.
+    """
+    global _num_users
+    if _num_users is not None:
+        _num_users += num
@@ -6,12 +6,15 @@
 import os
 import traceback
 from datetime import datetime
-from io import StringIO
-from typing import List
+from io import BytesIO
+from typing import List, TYPE_CHECKING
 
-import discord
+if TYPE_CHECKING:
+    import discord
 
-import strings
+
+_curdir: str = os.path.abspath(os.path.curdir)
+"""Absolute path to working directory at startup, trimmed from file paths in tracebacks."""
 
 
 def log(error: Exception) -> None:
@@ -20,18 +23,18 @@ def log(error: Exception) -> None:
         error))
 
 def format_traceback(error: Exception) -> str:
-    curdir: str = os.path.abspath(os.path.curdir)
     tb_lines: List[str] = [
-        "".join([
-            f"\"{line.split(curdir, 1)[-1]}"
-            if line.lstrip().startswith("File") else line
-        ]) for line in
+        f"\"{line.split(_curdir, 1)[-1]}"
+        if line.lstrip().startswith("File") else line
+        for line in
         traceback.format_exception(None, error, error.__traceback__)]
     return "\n".join(tb_lines)
 
-def traceback_as_file(error: Exception) -> discord.File:
-    s: StringIO = StringIO()
-    s.write(format_traceback(error))
-    s.seek(0)
+def traceback_as_file(error: Exception) -> "discord.File":
+    # Imported on use so that logging errors doesn't require the discord stack
+    import discord
+    import strings
+
+    s: BytesIO = BytesIO(format_traceback(error).encode("utf-8"))
     fp = datetime.now().strftime("Error_" + strings.get("datetime_format_log")) + ".txt"
     return discord.File(s, filename=fp)
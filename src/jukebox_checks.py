@@ -6,9 +6,13 @@
 """
 Contents:
     Check errors
+    Check roles
+    Check messages
+    Check results
     Check functions
 """
-from typing import Union, List
+from typing import Union, FrozenSet, Callable, Dict
+from weakref import WeakKeyDictionary
 
 import discord
 from discord.ext import commands
@@ -29,22 +33,68 @@ class CheckFailureQuietly(commands.CheckFailure):
     pass
 
 
+# Check roles
+
+
+ROLE_IDS_ADMIN: FrozenSet[int] = frozenset({config.ROLE_ADMIN})
+"""Role IDs permitted to use admin commands."""
+ROLE_IDS_TRUSTED: FrozenSet[int] = frozenset({config.ROLE_TRUSTED, config.ROLE_JUKEBOX, config.ROLE_ADMIN})
+"""Role IDs permitted to use trusted commands."""
+ROLE_IDS_DEFAULT: FrozenSet[int] = frozenset({config.ROLE_DEFAULT, config.ROLE_TRUSTED, config.ROLE_JUKEBOX, config.ROLE_ADMIN})
+"""Role IDs permitted to use default commands."""
+
+
+# Check messages
+
+
+CHANNEL_VOICE_MENTION: str = "<#{0}>".format(config.CHANNEL_VOICE)
+"""Mention for the voice channel used in voice-only messages, built from its ID without fetching the channel."""
+
+
+# Check results
+
+
+_check_cache: "WeakKeyDictionary[Context, Dict[str, bool]]" = WeakKeyDictionary()
+"""Results of checks for each command being checked, dropped along with the command's context."""
+
+
 # Check functions
 
 
-def _check_roles(user: Union[discord.User, discord.Member], role_ids: List[int]) -> bool:
+def _check_roles(user: Union[discord.User, discord.Member], role_ids: FrozenSet[int]) -> bool:
     """
     Check roles
     Source: StardewValleyDiscord - Autumn2022
     :param user: A user or member object, where a user that is not a member is ensured not to have any roles.
-    :param role_ids: A list of role IDs to check for.
-    :return: Whether a user has any of the roles in a given list.
+    :param role_ids: A set of role IDs to check for.
+    :return: Whether a user has any of the roles in a given set.
+    """
+    return isinstance(user, discord.Member) and any(r.id in role_ids for r in user.roles)
+
+def _check_admin(user: Union[discord.User, discord.Member]) -> bool:
+    """
+    Check admin
+    :param user: A user or member object, where a user that is not a member is ensured not to be an admin.
+    :return: Whether a user has server administrator permissions or any admin roles, checking permissions first.
+    """
+    return isinstance(user, discord.Member) \
+        and (user.guild_permissions.administrator or _check_roles(user, ROLE_IDS_ADMIN))
+
+def _check_cached(ctx: Context, name: str, check: Callable[[], bool]) -> bool:
+    """
+    Check once per command
+    :param ctx: Context of the command being checked, used to store results for the lifetime of the command.
+    :param name: Name used to identify the check.
+    :param check: Function returning the result of the check, called only if not yet checked for this command.
+    :return: Result of the check for this command.
     """
-    return (isinstance(user, discord.Member)
-            and len(role_ids) > 0 and len([r for r in user.roles if r.id in role_ids]) > 0)
+    cache: Dict[str, bool] = _check_cache.setdefault(ctx, {})
+    if name not in cache:
+        cache[name] = check()
+    return cache[name]
 
 async def is_admin(ctx: Context, send_message: bool = True) -> bool:
-    facts = _check_roles(ctx.author, [config.ROLE_ADMIN])
+    facts = _check_cached(ctx, "is_admin", lambda: _check_admin(ctx.author))
     if not facts and send_message:
         msg = strings.get("error_command_role_permissions")
         await ctx.reply(content=msg)
@@ -52,7 +102,7 @@ async def is_admin(ctx: Context, send_message: bool = True) -> bool:
 
 
 async def is_trusted(ctx: Context, send_message: bool = True) -> bool:
-    facts = _check_roles(ctx.author, [config.ROLE_TRUSTED, config.ROLE_JUKEBOX, config.ROLE_ADMIN])
+    facts = _check_cached(ctx, "is_trusted", lambda: _check_roles(ctx.author, ROLE_IDS_TRUSTED))
     if not facts and send_message:
         msg = strings.get("error_command_role_permissions")
         await ctx.reply(content=msg)
@@ -60,7 +110,7 @@ async def is_trusted(ctx: Context, send_message: bool = True) -> bool:
 
 
 async def is_default(ctx: Context, send_message: bool = True) -> bool:
-    facts = _check_roles(ctx.author, [config.ROLE_DEFAULT, config.ROLE_TRUSTED, config.ROLE_JUKEBOX, config.ROLE_ADMIN])
+    facts = _check_cached(ctx, "is_default", lambda: _check_roles(ctx.author, ROLE_IDS_DEFAULT))
     if not facts and send_message:
         msg = strings.get("error_command_role_permissions")
         await ctx.reply(content=msg)
@@ -69,11 +119,11 @@ async def is_default(ctx: Context, send_message: bool = True) -> bool:
 
 async def is_voice_only(ctx: Context, send_message: bool = True) -> bool:
     # Filter voice-only command uses by users currently in the voice channel
-    facts = jukebox.is_in_voice_channel(member=ctx.author) or _check_roles(ctx.author, [config.ROLE_ADMIN])
+    facts = jukebox.is_in_voice_channel(member=ctx.author) or _check_admin(ctx.author)
     if not facts and send_message:
         # Users can only play the jukebox if they're in the voice channel
         msg = strings.get("error_command_voice_only").format(
-            jukebox.bot.get_channel(config.CHANNEL_VOICE).mention)
+            CHANNEL_VOICE_MENTION)
         await ctx.reply(content=msg)
     return facts
 
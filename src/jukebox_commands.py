@@ -28,19 +28,21 @@ Contents:
     Discord.py boilerplate
 """
 
+import asyncio
+import functools
 import json
 import os
-from io import StringIO
+from io import BytesIO
 
 import pkg_resources
 import random
 import re
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 from importlib import reload
 from importlib import metadata
 from math import ceil, floor
-from typing import List, Dict, Union, Optional, Any, Tuple
+from typing import List, Dict, Union, Optional, Any, Tuple, Deque, Set
 from urllib import request
 
 import discord
@@ -52,6 +54,7 @@ from lyricsgenius import Genius
 from lyricsgenius.song import Song
 
 import config
+import err
 import jukebox_checks
 import jukebox_impl
 import strings
@@ -63,8 +66,10 @@ from db import DBUser
 class Vote:
     # Values
 
-    votes: Dict[discord.Message, "Vote"] = {}
-    """Map of current votes keyed by their respective messages."""
+    votes: Dict[int, "Vote"] = {}
+    """Map of current votes keyed by their respective message IDs."""
+    active_by_type: Dict[int, "Vote"] = {}
+    """Map of current votes keyed by their respective vote types."""
 
     # Constants
 
@@ -85,6 +90,12 @@ class Vote:
         """Any additional data to be parsed by the vote finaliser."""
         self.end_func: any = end_func
         """Function finalising the vote after vote succeeds, whether for or against."""
+        self.message: Optional[discord.PartialMessage] = None
+        """Message used to hold the vote, set once the vote has started."""
+        self.yes_voters: Set[int] = set()
+        """IDs of users currently voting for the vote."""
+        self.no_voters: Set[int] = set()
+        """IDs of users currently voting against the vote."""
 
     # Utility functions
 
@@ -96,53 +107,68 @@ class Vote:
         :param vote:
         :param start_msg: String to use as a subtitle in the vote message.
         """
-        if any(v.vote_type == vote.vote_type for v in Vote.votes.values()):
+        if vote.vote_type in cls.active_by_type:
             msg: str = strings.get("info_vote_in_progress")
             await ctx.reply(content=msg)
             return
 
+        # Vote type is reserved before sending the vote message to avoid starting duplicate votes in the meantime
+        cls.active_by_type[vote.vote_type] = vote
         msg: str = strings.get("info_vote_start").format(start_msg)
-        vote_message: discord.Message = await ctx.reply(content=msg)
-        cls.votes[vote_message] = vote
+        try:
+            vote_message: discord.Message = await ctx.reply(content=msg)
+        except discord.HTTPException:
+            cls.active_by_type.pop(vote.vote_type, None)
+            raise
+        vote.message = vote_message.channel.get_partial_message(vote_message.id)
+        cls.votes[vote_message.id] = vote
         await vote_message.add_reaction(strings.emoji_vote_yes)
         if vote.allow_no:
             await vote_message.add_reaction(strings.emoji_vote_no)
 
     @classmethod
-    async def check_vote(cls, reaction: discord.Reaction) -> None:
-        """
-        Checks whether a vote is completed based on a given reaction, and if so, runs its on-end function.
-        :param reaction: Reaction object with emoji and number of reactions used to check vote progress.
-        """
-        vote: Vote = cls.votes.get(reaction.message)
-        if vote:
-            vote_count = reaction.count - 1  # We subtract 1 to discount this bots original reaction
-            required_count = Vote.required_votes()
-            vote_succeeded = reaction.emoji == strings.emoji_vote_yes and vote_count >= required_count
-            vote_failed = vote.allow_no and reaction.emoji == strings.emoji_vote_no and vote_count > required_count
-            if vote_succeeded or vote_failed:
-                end_msg = strings.get("info_vote_success" if vote_succeeded else "info_vote_failure").format(
-                    "{0}",
-                    vote_count,
-                    required_count,
-                    reaction.emoji)
-                cls.votes.pop(reaction.message)
-                await vote.end_func(
-                    ctx=reaction.message,
-                    vote=vote,
-                    success=vote_succeeded,
-                    end_msg=end_msg)
+    async def check_vote(cls, vote: "Vote", emoji: str) -> None:
+        """
+        Checks whether a vote is completed based on its current voters, and if so, runs its on-end function.
+        :param vote: Vote to check.
+        :param emoji: Emoji of the reaction just added, used to check vote progress for or against.
+        """
+        voters: Set[int] = vote.yes_voters if emoji == strings.emoji_vote_yes else vote.no_voters
+        vote_count = len(voters)
+        required_count = Vote.required_votes()
+        vote_succeeded = emoji == strings.emoji_vote_yes and vote_count >= required_count
+        vote_failed = vote.allow_no and emoji == strings.emoji_vote_no and vote_count > required_count
+        if vote_succeeded or vote_failed:
+            end_msg = strings.get("info_vote_success" if vote_succeeded else "info_vote_failure").format(
+                "{0}",
+                vote_count,
+                required_count,
+                emoji)
+            cls.votes.pop(vote.message.id)
+            cls.active_by_type.pop(vote.vote_type, None)
+            await vote.end_func(
+                ctx=vote.message,
+                vote=vote,
+                success=vote_succeeded,
+                end_msg=end_msg)
 
     @classmethod
     async def clear_votes(cls) -> None:
         """
         Clears all current votes, replacing their respective messages with a self-destructing notice.
         """
-        for message in cls.votes.keys():
-            await message.edit(
-                content=strings.get("info_vote_expire"),
-                delete_after=10)
+        # Votes are cleared before editing so that no votes are completed or started against them in the meantime
+        votes: List[Vote] = list(cls.votes.values())
         cls.votes.clear()
+        cls.active_by_type.clear()
+        msg: str = strings.get("info_vote_expire")
+        # Messages may have been deleted in the meantime, which shouldn't stop other messages or the caller
+        results: List[Union[discord.Message, BaseException]] = await asyncio.gather(
+            *[vote.message.edit(content=msg, delete_after=10) for vote in votes],
+            return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                err.log(result)
 
     @classmethod
     def required_votes(cls) -> int:
@@ -154,13 +180,34 @@ class Vote:
     # Runtime events
 
     @staticmethod
-    async def on_reaction_add(reaction: discord.Reaction, user: discord.User) -> None:
+    async def on_raw_reaction_add(payload: discord.RawReactionActionEvent) -> None:
         # Update votes based on reactions, ignoring reactions from users not in the designated text channel
-        if reaction.message.channel.id == config.CHANNEL_TEXT \
-                and not user.bot \
-                and isinstance(user, discord.Member) \
-                and jukebox.is_in_voice_channel(member=user):
-            await Vote.check_vote(reaction=reaction)
+        # Raw events are used so that votes don't depend on their messages remaining in the message cache
+        vote: Optional[Vote] = Vote.votes.get(payload.message_id)
+        if vote \
+                and payload.channel_id == config.CHANNEL_TEXT \
+                and payload.member \
+                and not payload.member.bot \
+                and jukebox.is_in_voice_channel(member=payload.member):
+            emoji: str = str(payload.emoji)
+            if emoji == strings.emoji_vote_yes:
+                vote.yes_voters.add(payload.user_id)
+            elif emoji == strings.emoji_vote_no:
+                vote.no_voters.add(payload.user_id)
+            else:
+                return
+            await Vote.check_vote(vote=vote, emoji=emoji)
+
+    @staticmethod
+    async def on_raw_reaction_remove(payload: discord.RawReactionActionEvent) -> None:
+        # Withdraw votes from users removing their reactions
+        vote: Optional[Vote] = Vote.votes.get(payload.message_id)
+        if vote:
+            emoji: str = str(payload.emoji)
+            if emoji == strings.emoji_vote_yes:
+                vote.yes_voters.discard(payload.user_id)
+            elif emoji == strings.emoji_vote_no:
+                vote.no_voters.discard(payload.user_id)
 
 
 # Commands
@@ -205,14 +252,16 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
             self.entries: List[dict] = entries[:25]
 
             # Track result items
+            description_fmt: str = strings.get("jukebox_found_description")
+            emoji_digits: List[str] = strings.emoji_digits
             options: List[discord.SelectOption] = [discord.SelectOption(
                 label=track.get("title"),
                 value=str(i),
-                description=strings.get("jukebox_found_description").format(
+                description=description_fmt.format(
                     track.get("uploader"),
                     format_duration(sec=track.get("duration"))),
-                emoji=strings.emoji_digits[i + 1]
-            ) for i, track in enumerate(entries)]
+                emoji=emoji_digits[i + 1]
+            ) for i, track in enumerate(self.entries)]
 
             # Cancel interaction item
             options.append(discord.SelectOption(
@@ -231,7 +280,7 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
             Override.
             Handles interactions with track result options in select item.
             """
-            if not any(self.values):
+            if not self.values:
                 return
 
             if self.values[0] == self.VALUE_CANCEL:
@@ -244,7 +293,7 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
             starting_from_empty: bool = jukebox.is_empty()
 
             # Add selected track to queue
-            jukebox.append(track)
+            index: int = jukebox.append(track)
 
             # Join voice channel and start playing
             if not (jukebox.voice_client and jukebox.voice_client.is_playing()) and jukebox.is_in_voice_channel(interaction.user):
@@ -258,7 +307,6 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
                     track.added_by.mention,
                     format_duration(sec=track.duration))
             else:
-                index = jukebox.get_index_of_item(item=track)
                 description = strings.get("jukebox_added_one").format(
                     track.title,
                     format_duration(sec=track.duration),
@@ -292,16 +340,18 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
             self.entries: List[dict] = entries[:25]
 
             # Lyrics result items
+            description_fmt: str = strings.get("jukebox_found_description")
+            emoji_digits: List[str] = strings.emoji_digits
             options: List[discord.SelectOption] = [discord.SelectOption(
                 label=song.get("title"),
                 value=str(i),
-                description=strings.get("jukebox_found_description").format(
+                description=description_fmt.format(
                     song.get("artist_names"),
-                    song.get("release_date_components").get("year"))
-                if song.get("release_date_components")
+                    release_date.get("year"))
+                if (release_date := song.get("release_date_components"))
                 else song.get("artist_names"),
-                emoji=strings.emoji_digits[i + 1]
-            ) for i, song in enumerate(entries)]
+                emoji=emoji_digits[i + 1]
+            ) for i, song in enumerate(self.entries)]
 
             # Cancel interaction item
             options.append(discord.SelectOption(
@@ -320,7 +370,7 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
             Override.
             Handles interactions with track result options in select item.
             """
-            if not any(self.values):
+            if not self.values:
                 return
 
             if self.values[0] == self.VALUE_CANCEL:
@@ -346,13 +396,23 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
     """Whether commands are blocked for non-admin users."""
     listening_users: Dict[int, int] = {}
     """Map of users in the voice channel on track playback started, and the track timestamp they joined at."""
-    start_time: datetime = datetime.utcnow()
+    start_time: datetime = datetime.now(timezone.utc)
     """Datetime instance recording start time for commands cog."""
 
     # Constants
 
     ERROR_BAD_PARAMS: str = "Bad command paramters: {0}"
     """Error string for commands with invalid parameters."""
+    INDEX_PATTERN: re.Pattern = re.compile(r"[0-9]{1,4}")
+    """Pattern matching queries used as an index in the queue, limited to ASCII digits accepted by int()."""
+    AVATAR_TYPE_PATTERN: re.Pattern = re.compile(r"image/(png|jpe?g)")
+    """Pattern matching content types of attachments accepted as avatars."""
+    NON_DIGIT_PATTERN: re.Pattern = re.compile(r"\D")
+    """Pattern matching characters stripped from mentions to leave only their IDs."""
+    LYRICS_ARTEFACT_PATTERN: re.Pattern = re.compile(r"You might also like|\d*Embed")
+    """Pattern matching artefacts cropped out of raw lyrics text."""
+    LYRICS_TAG_PATTERN: re.Pattern = re.compile(r"\[.+\]")
+    """Pattern matching context tags in lyrics text, such as verse and chorus headings."""
 
     # Init
 
@@ -380,7 +440,7 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
                 if not jukebox.is_in_voice_channel(member=ctx.author):
                     # Users can only play the jukebox if they're in the voice channel
                     msg = strings.get("error_command_voice_only").format(
-                        Commands.bot.get_channel(config.CHANNEL_VOICE).mention)
+                        jukebox_checks.CHANNEL_VOICE_MENTION)
                 else:
                     # Fetch metadata for tracks based on the given query
                     entries: List[dict] = await jukebox_impl.YTDLSource.get_playlist_info(
@@ -388,7 +448,7 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
                         loop=Commands.bot.loop,
                         ambiguous=True)
 
-                    if not any(entries):
+                    if not entries:
                         msg = strings.get("error_track")
                     else:
                         title: str = strings.get("jukebox_found_title").format(ctx.author.display_name)
@@ -419,7 +479,7 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
         description: Optional[str] = None
         current: Optional[JukeboxItem] = None
 
-        if query and query.isdigit():
+        if query and self.INDEX_PATTERN.fullmatch(query):
             # Digit queries search by index in queue to re-add a track
             current = jukebox.get_item_by_index(index=int(query))
             if not current:
@@ -441,10 +501,10 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
                         if not jukebox.is_in_voice_channel(member=ctx.author):
                             # Users can only play the jukebox if they're in the voice channel
                             msg = strings.get("error_command_voice_only").format(
-                                Commands.bot.get_channel(config.CHANNEL_VOICE).mention)
+                                jukebox_checks.CHANNEL_VOICE_MENTION)
                         else:
                             # Playing a populated queue will continue from the current track
-                            if not (jukebox.voice_client and jukebox.voice_client.is_playing()) and jukebox.is_in_voice_channel(ctx.author):
+                            if not (jukebox.voice_client and jukebox.voice_client.is_playing()):
                                 await ensure_voice()
                                 jukebox.play()
 
@@ -473,12 +533,10 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
                     # Parse results into an embed, add as many tracks as possible
                     if not source:
                         msg = strings.get("error_track")
-                    elif not any(entries):
+                    elif not entries:
                         msg = strings.get("error_track" if num_failed < 2 else "error_track_all")
                     else:
-                        extractor: str = entries[0].get("extractor").split(sep=":")[0] \
-                            if entries[0] and "extractor" in entries[0].keys() \
-                            else None
+                        extractor: Optional[str] = (entries[0].get("extractor") or "").partition(":")[0] or None
                         if not extractor:
                             # Check for invalid extractors
                             msg = strings.get("error_extractor_not_found").format(query)
@@ -486,21 +544,27 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
                             # Check for untrusted extractors
                             msg = strings.get("error_domain_not_whitelisted").format(extractor)
                         else:
-                            # Check for excessively large track lists
-                            playlist_duration = sum([int(track.get("duration", 0)) for track in entries])
-
                             # Prepare the playlist audio files
                             playlist_items = await jukebox_impl.YTDLSource.get_playlist_files(
                                 playlist_info=entries,
                                 is_streaming=config.PLAYLIST_STREAMING,
-                                added_by=ctx.author)
+                                added_by=ctx.author,
+                                loop=Commands.bot.loop)
 
-                    # If no messages (errors) were made, add tracks to the queue
-                    if not msg and any(playlist_items):
-                        for playlist_item in playlist_items:
-                            jukebox.append(item=playlist_item)
+                            # Check for tracks that failed to process or download
+                            num_failed += len(entries) - len(playlist_items)
+                            if not playlist_items:
+                                msg = strings.get("error_track" if num_failed < 2 else "error_track_all")
 
+                            # Check for excessively large track lists
+                            playlist_duration = sum(track.duration for track in playlist_items)
+
+                    # If no messages (errors) were made, add tracks to the queue
+                    if not msg and playlist_items:
                         playlist_head: JukeboxItem = playlist_items[0]
+                        playlist_head_index: int = jukebox.append(item=playlist_head)
+                        for playlist_item in playlist_items[1:]:
+                            jukebox.append(item=playlist_item)
 
                         # Join voice and start playing if not currently playing and command user is in voice
                         if not (jukebox.voice_client and jukebox.voice_client.is_playing()) and jukebox.is_in_voice_channel(ctx.author):
@@ -523,7 +587,7 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
                             description = strings.get("jukebox_added_one").format(
                                 playlist_head.title,
                                 format_duration(sec=playlist_head.duration),
-                                jukebox.get_index_of_item(playlist_head) + 1)
+                                playlist_head_index + 1)
                         elif 0 < num_failed < len(entries):
                             # One or more tracks in a playlist failed to download
                             description = strings.get("jukebox_current_added_playlist").format(
@@ -535,7 +599,7 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
                             description = strings.get("jukebox_added_many").format(
                                 title,
                                 format_duration(sec=playlist_duration, is_playlist=True),
-                                jukebox.get_index_of_item(playlist_head) + 1,
+                                playlist_head_index + 1,
                                 len(playlist_items))
             except yt_dlp.DownloadError:
                 # Suppress and message download errors
@@ -570,12 +634,13 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
         :param skip_count: Number of tracks to remove.
         """
         msg: Optional[str] = None
-        async with ctx.typing():
-            if jukebox.is_empty():
-                msg = get_empty_queue_msg()
-            else:
+        if jukebox.is_empty():
+            msg = get_empty_queue_msg()
+        else:
+            async with ctx.typing():
                 tracks: List[JukeboxItem] = jukebox.get_range(index_start=0, index_end=skip_count)
-                if all(track.added_by is ctx.message.author for track in tracks) or await is_admin(ctx=ctx, send_message=False) \
+                author_id: int = ctx.author.id
+                if all(track.added_by.id == author_id for track in tracks) or await is_admin(ctx=ctx, send_message=False) \
                         or Vote.required_votes() <= 1:
                     await self._do_skip(
                         ctx=ctx,
@@ -597,8 +662,8 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
                     msg = strings.get("error_privileges_other").format(
                         ctx.guild.get_role(config.ROLE_TRUSTED).mention,
                         ctx.command)
-            if msg:
-                await ctx.reply(content=msg)
+        if msg:
+            await ctx.reply(content=msg)
 
     @commands.command(name="delete", aliases=["d"])
     @commands.check(is_default)
@@ -617,9 +682,7 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
 
         msg: Optional[str] = None
         async with ctx.typing():
-            if jukebox.is_empty():
-                msg = get_empty_queue_msg()
-            elif track.added_by.id == ctx.author.id or await is_admin(ctx=ctx, send_message=False) \
+            if track.added_by.id == ctx.author.id or await is_admin(ctx=ctx, send_message=False) \
                     or Vote.required_votes() <= 1:
                 await self._do_delete(
                     ctx=ctx,
@@ -650,26 +713,25 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
     @commands.check(is_voice_only)
     async def shuffle(self, ctx: Context) -> None:
         """
-        Shuffles the queue in-place, stopping the currently-playing track and restarting with the new current track.
+        Shuffles the queue in-place, leaving the currently-playing track to continue playback.
         """
-        async with ctx.typing():
-            msg: str
-            queue: List[JukeboxItem] = jukebox.get_queue(ctx.author.id)
-            if not any(queue):
-                # Shuffling an empty queue does nothing
-                msg = get_empty_queue_msg()
-            elif len(queue) == 1:
-                # Shuffling a single track also does nothing
-                msg = strings.get("jukebox_shuffled_one").format(
-                    strings.emoji_refresh)
-            else:
-                # Shuffling a populated queue reorders the tracks and restarts the new currently-playing track
-                shuffle_count: int = jukebox.shuffle(user_id=queue[0].added_by.id)
-                msg = strings.get("jukebox_shuffled").format(
-                    queue[0].title,
-                    shuffle_count,
-                    strings.emoji_shuffle)
-            await ctx.reply(content=msg)
+        msg: str
+        queue: Deque[JukeboxItem] = jukebox.get_queue(ctx.author.id)
+        if not queue:
+            # Shuffling an empty queue does nothing
+            msg = get_empty_queue_msg()
+        elif len(queue) == 1:
+            # Shuffling a single track also does nothing
+            msg = strings.get("jukebox_shuffled_one").format(
+                strings.emoji_refresh)
+        else:
+            # Shuffling a populated queue reorders all tracks after the currently-playing track
+            shuffle_count: int = jukebox.shuffle(user_id=queue[0].added_by.id)
+            msg = strings.get("jukebox_shuffled").format(
+                queue[0].title,
+                shuffle_count,
+                strings.emoji_shuffle)
+        await ctx.reply(content=msg)
 
     @commands.command(name="bump", aliases=["b"])
     @commands.check(is_default)
@@ -679,39 +741,38 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
         Bumps a track up to the head of the queue.
         """
         msg: Optional[str] = None
-        async with ctx.typing():
-            is_implicit: bool = index != -1
-            queue: List[JukeboxItem] = jukebox.get_queue(user_id=ctx.author.id)
-            index = index if index > 0 else len(queue) if queue else 0  # Use track at end of queue if index not given
-            current: JukeboxItem = jukebox.current_track()  # Current track is ignored for bumping
-            track: JukeboxItem = jukebox.get_item_by_index(index=index - 1)  # Reduce given index for 0-indexing
-            is_valid_user = track.added_by.id == ctx.author.id \
-                or (await is_admin(ctx=ctx, send_message=False) and not is_implicit)
-            if jukebox.is_empty():
-                # Ignore if no tracks are in the queue
-                msg = get_empty_queue_msg()
-            elif not track:
-                # Ignore if no track was at the given index
-                msg = strings.get("error_bump_not_found")
-            elif not is_valid_user:
-                # Ignore tracks added by other users, and prevent admins from bumping others implicitly
-                msg = strings.get("error_bump_user").format(
-                    track.title,
-                    track.added_by.mention,
-                    index)
-            elif (current and track and current is track) \
-                    or (current and queue and len(queue) > 1 and current in queue and queue[1] is track) \
-                    or (queue and any(queue) and queue[0] is track):
-                # Ignore attempts to bump the currently-playing track or tracks at the head of the queue
-                msg = strings.get("error_bump_current_at_end" if is_implicit else "error_bump_current")
-            else:
-                # Bump the track
-                jukebox.bump(item=track)
-                msg = strings.get("jukebox_bump").format(
-                    strings.emoji_bump,
-                    track.title,
-                    format_duration(sec=track.duration, is_playlist=False),
-                    jukebox.get_index_of_item(item=track) + 1)  # Increase result index for 1-indexing
+        is_implicit: bool = index != -1
+        queue: Deque[JukeboxItem] = jukebox.get_queue(user_id=ctx.author.id)
+        index = index if index > 0 else len(queue) if queue else 0  # Use track at end of queue if index not given
+        current: JukeboxItem = jukebox.current_track()  # Current track is ignored for bumping
+        track: JukeboxItem = jukebox.get_item_by_index(index=index - 1)  # Reduce given index for 0-indexing
+        is_valid_user = track.added_by.id == ctx.author.id \
+            or (await is_admin(ctx=ctx, send_message=False) and not is_implicit)
+        if jukebox.is_empty():
+            # Ignore if no tracks are in the queue
+            msg = get_empty_queue_msg()
+        elif not track:
+            # Ignore if no track was at the given index
+            msg = strings.get("error_bump_not_found")
+        elif not is_valid_user:
+            # Ignore tracks added by other users, and prevent admins from bumping others implicitly
+            msg = strings.get("error_bump_user").format(
+                track.title,
+                track.added_by.mention,
+                index)
+        elif current is track \
+                or (queue and queue[0] is track) \
+                or (len(queue) > 1 and queue[0] is current and queue[1] is track):
+            # Ignore attempts to bump the currently-playing track or tracks at the head of the queue
+            msg = strings.get("error_bump_current_at_end" if is_implicit else "error_bump_current")
+        else:
+            # Bump the track
+            jukebox.bump(item=track)
+            msg = strings.get("jukebox_bump").format(
+                strings.emoji_bump,
+                track.title,
+                format_duration(sec=track.duration, is_playlist=False),
+                jukebox.get_index_of_item(item=track) + 1)  # Increase result index for 1-indexing
         if msg:
             await ctx.reply(content=msg)
 
@@ -727,24 +788,25 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
         async with ctx.typing():
             try:
                 # Accept users by fuzzy query
+                author_id: int = ctx.author.id
                 if not query:
-                    query = ctx.author.id
+                    query = author_id
                 user: discord.User = await commands.UserConverter().convert(
                     ctx=ctx,
                     argument=str(query))
                 # Wipe all tracks from a user in the given queue
-                queue: List[JukeboxItem] = jukebox.get_queue(user_id=user.id)
-                if not any(queue):
+                queue: Deque[JukeboxItem] = jukebox.get_queue(user_id=user.id)
+                if not queue:
                     msg = get_empty_queue_msg()
                 # For multiqueue, we can assume all tracks in a user's queue are their own
+                # Either way, all tracks are added by the given user, so only the user need be checked against the author
                 tracks: List[JukeboxItem] = [track for track in queue if track.added_by.id == user.id] \
                     if not config.PLAYLIST_MULTIQUEUE \
                     else [*queue]  # Use a copy of the tracks to avoid issues when removing
-                if not any(tracks):
+                if not tracks:
                     # Ignore calls to wipe an empty queue
                     msg = strings.get("info_wipe_failure")
-                elif user.id == ctx.author.id or await is_admin(ctx=ctx, send_message=False) \
-                        or all(track.added_by.id == ctx.author.id for track in tracks) \
+                elif user.id == author_id or await is_admin(ctx=ctx, send_message=False) \
                         or Vote.required_votes() <= 1:
                     # For queue-owner and admin calls, wipe the queue immediately
                     await self._do_wipe(
@@ -788,7 +850,7 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
                 embed = get_empty_queue_embed(guild=ctx.guild)
             else:
                 queue_length: int = jukebox.num_tracks()
-                queue_duration: str = format_duration(sec=sum([track.duration for track in jukebox.get_all()]), is_playlist=True)
+                queue_duration: str = format_duration(sec=jukebox.total_duration(), is_playlist=True)
 
                 # Pagination is bounded to length of the playlist
                 pagination_count: int = 10
@@ -808,12 +870,13 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
                 index_start: int = pagination_count * page_num
                 index_end: int = index_start + pagination_count
                 tracks: List[JukeboxItem] = jukebox.get_range(index_start=index_start, index_end=index_end)
-                track_msgs: List[str] = [strings.get("jukebox_queue_item").format(
-                    index_start + i + 1,
+                track_fmt: str = strings.get("jukebox_queue_item")
+                track_msgs: List[str] = [track_fmt.format(
+                    i,
                     format_duration(sec=track.duration),
                     track.added_by.mention,
                     track.title)
-                        for i, track in enumerate(iterable=tracks)]
+                        for i, track in enumerate(tracks, start=index_start + 1)]
 
                 # currently-playing track
                 title: str = strings.get("jukebox_title").format(
@@ -822,7 +885,7 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
                     else strings.get("status_paused").format(current.title, strings.emoji_pause))
 
                 # all other queued tracks on the current page
-                msg_lines.append("\n".join(iter(track_msgs)))
+                msg_lines.append("\n".join(track_msgs))
 
                 # queue loop status
                 if await is_looping_enabled(ctx=ctx):
@@ -837,7 +900,7 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
                     page_num + 1,
                     page_max)
 
-                emoji: discord.Emoji = utils.get(Commands.bot.emojis, name=strings.get("emoji_id_jukebox"))
+                emoji: discord.Emoji = get_emoji(name=strings.get("emoji_id_jukebox"))
                 embed = discord.Embed(
                     title=title,
                     description="\n".join(msg_lines),
@@ -921,7 +984,7 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
                 # Generate response
                 response: dict = genius.search_songs(search_term=query)
                 entries: List[Dict[str, str]] = [hit.get("result") for hit in response.get("hits", [])]
-                if not any(entries):
+                if not entries:
                     msg = strings.get("error_lyrics_not_found").format(query)
                 else:
                     title: str = strings.get("jukebox_found_lyrics").format(ctx.author.display_name)
@@ -1020,10 +1083,7 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
         """
         Forces the VoiceClient to connect or disconnect.
         """
-        print("Joining voice. [{0}#{1} ({2})]".format(
-            ctx.author.name,
-            ctx.author.discriminator,
-            ctx.author.id))
+        print("Joining voice. [{0}]".format(format_user(user=ctx.author)))
         await ensure_voice()
         is_bad: bool = is_voice_bad(guild=ctx.guild)
         await ctx.message.add_reaction(strings.emoji_error if is_bad else strings.emoji_confirm)
@@ -1037,10 +1097,8 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
         """
         Removes the bot from the voice channel and stops the currently-playing track.
         """
-        print("Leaving voice with {3} listeners. [{0}#{1} ({2})]".format(
-            ctx.author.name,
-            ctx.author.discriminator,
-            ctx.author.id,
+        print("Leaving voice with {1} listeners. [{0}]".format(
+            format_user(user=ctx.author),
             jukebox.num_listeners()))
         jukebox.stop()
         await ctx.guild.change_voice_state(channel=None)
@@ -1057,12 +1115,10 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
         Clears any tracks from the queue without running their after-play behaviours.
         Also clears temp files and folders.
         """
-        print("Clearing {3} tracks. [{0}#{1} ({2})]".format(
-            ctx.author.name,
-            ctx.author.discriminator,
-            ctx.author.id,
+        print("Clearing {1} tracks. [{0}]".format(
+            format_user(user=ctx.author),
             jukebox.num_tracks()))
-        jukebox.clear()
+        await jukebox.clear()
         await ctx.message.add_reaction(strings.emoji_confirm)
 
         # Update rich presence
@@ -1074,10 +1130,8 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
         """
         Clears any current votes without running their after-vote behaviours.
         """
-        print("Clearing {3} votes. [{0}#{1} ({2})]".format(
-            ctx.author.name,
-            ctx.author.discriminator,
-            ctx.author.id,
+        print("Clearing {1} votes. [{0}]".format(
+            format_user(user=ctx.author),
             len(Vote.votes)))
         await Vote.clear_votes()
         await ctx.message.add_reaction(strings.emoji_confirm)
@@ -1088,10 +1142,7 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
         """
         Block all commands from being used by non-admin users.
         """
-        print("Blocking commands. [{0}#{1} ({2})]".format(
-            ctx.author.name,
-            ctx.author.discriminator,
-            ctx.author.id))
+        print("Blocking commands. [{0}]".format(format_user(user=ctx.author)))
         Commands.is_blocking_commands = True
         await ctx.message.add_reaction(strings.emoji_lock_on)
 
@@ -1101,10 +1152,7 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
         """
         Unblock commands, re-enabling the jukebox for non-admin users.
         """
-        print("Unblocking commands. [{0}#{1} ({2})]".format(
-            ctx.author.name,
-            ctx.author.discriminator,
-            ctx.author.id))
+        print("Unblocking commands. [{0}]".format(format_user(user=ctx.author)))
         Commands.is_blocking_commands = False
         await ctx.message.add_reaction(strings.emoji_lock_off)
 
@@ -1114,11 +1162,8 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
         """
         Activates mango.
         """
-        print("Activating mango. [{0}#{1} ({2})]".format(
-            ctx.author.name,
-            ctx.author.discriminator,
-            ctx.author.id))
-        emoji: discord.Emoji = utils.get(jukebox.bot.emojis, name=strings.get("emoji_id_mango"))
+        print("Activating mango. [{0}]".format(format_user(user=ctx.author)))
+        emoji: discord.Emoji = get_emoji(name=strings.get("emoji_id_mango"))
         await ctx.message.add_reaction(emoji)
 
     @commands.command(name="reloadcommands", aliases=[], hidden=True)
@@ -1127,10 +1172,7 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
         """
         Reloads the commands extension, reapplying code changes and reloading the strings data file.
         """
-        print("Reloading commands. [{0}#{1} ({2})]".format(
-            ctx.author.name,
-            ctx.author.discriminator,
-            ctx.author.id))
+        print("Reloading commands. [{0}]".format(format_user(user=ctx.author)))
         await Commands.bot.reload_extension(name=config.PACKAGE_COMMANDS)
         await ctx.message.add_reaction(strings.emoji_confirm)
 
@@ -1182,10 +1224,7 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
         """
         Sends or updates pinned messages in the commands channel.
         """
-        print("Updating pinned messages. [{0}#{1} ({2})]".format(
-            ctx.author.name,
-            ctx.author.discriminator,
-            ctx.author.id))
+        print("Updating pinned messages. [{0}]".format(format_user(user=ctx.author)))
         channel: discord.TextChannel = Commands.bot.get_channel(config.CHANNEL_TEXT)
         messages: List[discord.Message] = await self._do_update_pinned_messages(
             ctx=ctx,
@@ -1202,32 +1241,34 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
         """
         Updates bot client display picture.
         """
-        print("Updating avatar. [{0}#{1} ({2})]".format(
-            ctx.author.name,
-            ctx.author.discriminator,
-            ctx.author.id))
+        print("Updating avatar. [{0}]".format(format_user(user=ctx.author)))
 
         msg: str = None
         attachment: discord.Attachment = None
         original_avatar: discord.File = None
         size_denom: int = 1000 * 1000
         size_max: int = 8
-
-        # Fetch avatar from attachments
-        if any(ctx.message.attachments):
-            images: list = [a for a in ctx.message.attachments if re.match(r"image/(png|jpe?g)", a.content_type)]
-            if any(images):
-                images_usable: list = [a for a in images if a.size < size_denom * size_max]
-                if not any(images_usable):
-                    msg = strings.get("error_avatar_size").format(size_max)
-                else:
-                    attachment = images_usable[0]
+        size_max_bytes: int = size_denom * size_max
+
+        # Fetch avatar from the first usable image in attachments
+        is_image_found: bool = False
+        for a in ctx.message.attachments:
+            if a.content_type and self.AVATAR_TYPE_PATTERN.match(a.content_type):
+                is_image_found = True
+                if a.size < size_max_bytes:
+                    attachment = a
+                    break
+        if is_image_found and not attachment:
+            msg = strings.get("error_avatar_size").format(size_max)
         if not attachment:
             if not msg:
                 msg = strings.get("error_avatar_not_found")
         else:
-            original_avatar = await Commands.bot.user.display_avatar.to_file()
-            attachment_bytes: bytes = await attachment.read()
+            # Fetch the original avatar alongside the new one, before it's replaced
+            attachment_bytes: bytes
+            original_avatar, attachment_bytes = await asyncio.gather(
+                Commands.bot.user.display_avatar.to_file(),
+                attachment.read())
             await Commands.bot.user.edit(avatar=attachment_bytes)
             await ctx.message.add_reaction(strings.emoji_confirm)
             msg = strings.get("info_update_avatar").format(attachment.filename)
@@ -1254,7 +1295,7 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
         channel: discord.TextChannel = ctx.guild.get_channel(config.CHANNEL_BULLETIN)
         message: discord.Message = await channel.send(embed=embed)
         for emoji_id in ["emoji_id_nukebox", "emoji_id_pam", "emoji_id_mango"]:
-            emoji: discord.Emoji = utils.get(Commands.bot.emojis, name=strings.get(emoji_id))
+            emoji: discord.Emoji = get_emoji(name=strings.get(emoji_id))
             await message.add_reaction(emoji)
 
     @commands.command(name="state", hidden=True)
@@ -1283,7 +1324,7 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
         msg: str
         embed: discord.Embed = discord.Embed(colour=get_embed_colour(ctx.guild))
 
-        delta_uptime = datetime.utcnow() - Commands.bot.start_time
+        delta_uptime = datetime.now(timezone.utc) - Commands.bot.start_time
         hours, remainder = divmod(int(delta_uptime.total_seconds()), 3600)
         minutes, seconds = divmod(remainder, 60)
         days, hours = divmod(hours, 24)
@@ -1338,17 +1379,12 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
     @commands.command(name="logs", aliases=["log"], hidden=True)
     @commands.check(is_admin)
     async def send_logs(self, ctx: Context) -> None:
-        fps: List[str] = [
-            os.path.join(config.LOG_DIR, file)
-            for file in os.listdir(config.LOG_DIR)
-        ]
+        with os.scandir(config.LOG_DIR) as it:
+            entries: List[os.DirEntry] = [entry for entry in it if entry.is_file()]
         files: List[discord.File] = []
-        for fp in fps:
-            with open(file=fp, mode="r", encoding="utf8") as file:
-                s: StringIO = StringIO()
-                s.write(file.read())
-                s.seek(0)
-                files.append(discord.File(s, filename=os.path.basename(fp)))
+        for entry in entries:
+            # Log files are opened by discord.py and streamed as-is, then closed once sent
+            files.append(discord.File(fp=entry.path, filename=entry.name))
 
         hours: float = float(datetime.now().astimezone().strftime("%z")) / 100
         msg: str = strings.get("info_logs" if files else "info_logs_none").format(
@@ -1359,19 +1395,19 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
     @commands.command(name="config", aliases=["cfg"], hidden=True)
     @commands.check(is_admin)
     async def send_config(self, ctx: Context) -> None:
-        cfg = None
-        with open(file=config.CONFIG_PATH, mode="r", encoding="utf8") as file:
-            js: dict = json.load(file)
-            js.pop("tokens")
-            s: StringIO = StringIO()
-            s.write(json.dumps(js, indent=2, sort_keys=False))
-            s.seek(0)
-            cfg = discord.File(s, filename=os.path.basename(config.CONFIG_PATH))
+        cfg: discord.File = discord.File(BytesIO(get_config_bytes()), filename=os.path.basename(config.CONFIG_PATH))
         msg: str = strings.get("info_config").format(Commands.bot.start_time.strftime(strings.get("datetime_format_uptime")))
         await ctx.reply(content=msg, file=cfg)
 
     # Runtime events
 
+    @staticmethod
+    async def on_guild_emojis_update(guild: discord.Guild, before: List[discord.Emoji], after: List[discord.Emoji]) -> None:
+        """
+        Clear custom emojis found by name, as any may have been renamed, replaced, or removed.
+        """
+        _emoji_cache.clear()
+
     @staticmethod
     async def on_voice_state_update(member: discord.Member, before: discord.VoiceState, after: discord.VoiceState) -> None:
         """
@@ -1380,24 +1416,20 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
         current: JukeboxItem = jukebox.current_track()
         if not after.channel or not after.channel.id == config.CHANNEL_VOICE or after.deaf or after.self_deaf:
             # Dismiss users who have left the voice channel or have deafened themselves
-            if member.id in Commands.listening_users.keys():
-                Commands.listening_users.pop(member.id)
-        elif after.channel and after.channel.id == config.CHANNEL_VOICE:
+            Commands.listening_users.pop(member.id, None)
+        else:
             # Note the time that the user joined the voice channel or undeafened themselves
             Commands.listening_users[member.id] = current.audio.progress() if current and current.audio else 0
 
-    def before_play(self, track: JukeboxItem) -> None:
+    async def before_play(self, track: JukeboxItem) -> None:
         """
         Behaviours to be run before the currently-playing track first starts playback.
         """
         # Add all users in the voice channel as current listeners joining at 0 seconds
-        Commands.listening_users = {user.id: 0 for user in jukebox.voice_client.channel.members}
+        Commands.listening_users = dict.fromkeys((user.id for user in jukebox.voice_client.channel.members), 0)
 
         # Update tracks added for user once their track has begun playing:
-        current: JukeboxItem = jukebox.current_track()
-        entry: DBUser = Commands.bot.db.get_user(user_id=current.added_by.id)
-        entry.tracks_added += 1
-        Commands.bot.db.update_user(entry=entry)
+        await Commands.bot.db.increment_user_stats(user_id=track.added_by.id, tracks_added=1)
 
     async def after_play(self, track: JukeboxItem) -> None:
         """
@@ -1407,12 +1439,14 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
         await Vote.clear_votes()
 
         # Update db
-        for user_id in Commands.listening_users.keys():
-            joined_at_duration: int = Commands.listening_users[user_id]
-            entry: DBUser = Commands.bot.db.get_user(user_id=user_id)
-            entry.tracks_listened += 1
-            entry.duration_listened += track.duration - joined_at_duration
-            Commands.bot.db.update_user(entry=entry)
+        await Commands.bot.db.increment_users_stats_bulk(increments=[
+            DBUser(
+                user_id=user_id,
+                tracks_added=0,
+                tracks_listened=1,
+                duration_listened=track.duration - joined_at_duration)
+            for user_id, joined_at_duration in Commands.listening_users.items()
+        ])
 
         # Post now-playing update
         channel: discord.TextChannel = jukebox.bot.get_channel(config.CHANNEL_TEXT)
@@ -1443,7 +1477,7 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
         """
         if any(Vote.votes):
             msg: str = strings.get("info_vote_collection_modified").format(len(Vote.votes))
-            await ctx.send(content=msg)
+            await ctx.channel.send(content=msg)
             await Vote.clear_votes()
 
         # Update rich presence
@@ -1551,7 +1585,7 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
                 raise commands.UserNotFound(query)
 
             # Fetch user's jukebox stats
-            entry: DBUser = Commands.bot.db.get_user(user_id=member.id)
+            entry: DBUser = await Commands.bot.db.get_user(user_id=member.id)
             duration_formatted: str = format_user_playtime(sec=entry.duration_listened)
 
             # Set description to user's jukebox stats
@@ -1572,13 +1606,14 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
             }
 
             # Set thumbnail to user's privilege icon
+            member_role_ids: Set[int] = {role.id for role in member.roles}
             member_visible_roles: List[Tuple[int, str]] = [
-                (role_id, visible_roles.get(role_id))
-                for role_id in visible_roles.keys()
-                if any(role.id == role_id for role in member.roles)]
-            emoji_id: str = member_visible_roles[0][1] if any(member_visible_roles) else "emoji_id_pam"
-            emoji: discord.Emoji = utils.get(jukebox.bot.emojis, name=strings.get(emoji_id))
-            role: discord.Role = ctx.guild.get_role(member_visible_roles[0][0]) if any(member_visible_roles) else None
+                (role_id, emoji_id)
+                for role_id, emoji_id in visible_roles.items()
+                if role_id in member_role_ids]
+            emoji_id: str = member_visible_roles[0][1] if member_visible_roles else "emoji_id_pam"
+            emoji: discord.Emoji = get_emoji(name=strings.get(emoji_id))
+            role: discord.Role = ctx.guild.get_role(member_visible_roles[0][0]) if member_visible_roles else None
             roles_str: str = "{0} {1}".format(emoji, role.mention) if role else None
 
             # Create embed
@@ -1602,20 +1637,22 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
         """
         Behaviours for sending or editing pinned text channel messages outlining jukebox info and rules.
         """
-        message_contents: List[str]
-        with open(file=config.PINS_PATH, mode="r", encoding="utf8") as file:
-            message_contents = json.load(file).get("messages")
+        message_contents: List[str] = get_pins()
 
         message_ids_separator: str = ' '
-        message_ids_raw: str = Commands.bot.db.get_rules_message_ids(guild_id=ctx.guild.id)
+        message_ids_raw: str = await Commands.bot.db.get_rules_message_ids(guild_id=ctx.guild.id)
         messages: List[discord.Message] = []
         if message_ids_raw:
-            try:
-                # Fetch messages from saved IDs
-                messages = [await channel.fetch_message(int(s)) for s in message_ids_raw.split(message_ids_separator)]
-            except discord.NotFound:
-                # Send new messages if any saved IDs have expired
-                pass
+            # Fetch messages from saved IDs together
+            results: List[Union[discord.Message, BaseException]] = await asyncio.gather(
+                *[channel.fetch_message(int(s)) for s in message_ids_raw.split(message_ids_separator)],
+                return_exceptions=True)
+            for result in results:
+                if isinstance(result, BaseException) and not isinstance(result, discord.NotFound):
+                    raise result
+            # Send new messages if any saved IDs have expired
+            if not any(isinstance(result, discord.NotFound) for result in results):
+                messages = results
 
         if not any(messages):
             # Send messages and save IDs to persistent data for later updates
@@ -1624,7 +1661,7 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
                     content=message_content,
                     allowed_mentions=discord.AllowedMentions.none())
                 messages.append(message)
-            Commands.bot.db.set_rules_message_ids(
+            await Commands.bot.db.set_rules_message_ids(
                 guild_id=ctx.guild.id,
                 message_ids=str.join(message_ids_separator, [str(message.id) for message in messages]))
             # Add messages to channel pins in bottom-to-top order
@@ -1651,7 +1688,7 @@ class Commands(commands.Cog, name=config.COG_COMMANDS):
 
     async def _get_bulletin_embed(self, guild: discord.Guild) -> discord.Embed:
         channel: discord.TextChannel = guild.get_channel(config.CHANNEL_TEXT)
-        emoji_jukebox: discord.Emoji = utils.get(Commands.bot.emojis, name=strings.get("emoji_id_jukebox"))
+        emoji_jukebox: discord.Emoji = get_emoji(name=strings.get("emoji_id_jukebox"))
         role_listen: discord.Role = guild.get_role(config.ROLE_LISTEN)
         role_default: discord.Role = guild.get_role(config.ROLE_DEFAULT)
         embed: discord.Embed = discord.Embed(
@@ -1683,7 +1720,7 @@ def parse_query(query: any) -> any:
         # Strip chars to be removed from query
         query = "".join([c for c in query.strip() if c not in remove_chars])
 
-    if query and query.isdigit():
+    if query and Commands.INDEX_PATTERN.fullmatch(query):
         # Treat digit queries as a queue index, assuming they're starting from 1
         index: int = int(query)
         if index < 1 or index > jukebox.num_tracks():
@@ -1702,7 +1739,10 @@ def mention_to_id(mention: [str, int]) -> int:
     :param mention: Discord ID or mention string.
     :return: Discord ID as digits only.
     """
-    return int(re.sub(r"\D", "", mention))
+    if isinstance(mention, int):
+        return mention
+    # Plain IDs are parsed directly, leaving only mentions to be stripped
+    return int(mention) if mention.isdecimal() else int(Commands.NON_DIGIT_PATTERN.sub("", mention))
 
 def query_channel(guild: discord.Guild, query: str) -> Optional[discord.abc.GuildChannel]:
     """
@@ -1736,6 +1776,22 @@ async def get_guild_message(guild: discord.Guild, message_id: int) -> discord.Me
             if e.code == 10008:
                 pass
 
+_emoji_cache: Dict[str, discord.Emoji] = {}
+"""Map of custom emojis found by name, cleared whenever any guild emojis are updated."""
+
+
+def get_emoji(name: str) -> Optional[discord.Emoji]:
+    """
+    Gets a custom emoji by name from any guild available to the bot, avoiding a search of all emojis once found.
+    :param name: Name of the emoji to find.
+    """
+    emoji: Optional[discord.Emoji] = _emoji_cache.get(name)
+    if emoji is None:
+        emoji = utils.get(jukebox.bot.emojis, name=name)
+        if emoji is not None:
+            _emoji_cache[name] = emoji
+    return emoji
+
 def get_embed_colour(guild: discord.Guild) -> discord.Colour:
     # return guild.get_role(config.ROLE_JUKEBOX).colour
     return guild.get_role(config.ROLE_JUKEBOX).colour
@@ -1750,7 +1806,7 @@ def get_current_track_embed(guild: discord.Guild, show_tracking: bool, descripti
     """
     embed: discord.Embed
     current: JukeboxItem = jukebox.current_track()
-    emoji: discord.Emoji = utils.get(jukebox.bot.emojis, name=strings.get("emoji_id_vinyl"))
+    emoji: discord.Emoji = get_emoji(name=strings.get("emoji_id_vinyl"))
     description_played: str = strings.get("jukebox_played").format(
         previous_track.title,
         format_duration(sec=previous_track.duration)) \
@@ -1778,7 +1834,7 @@ def get_current_track_embed(guild: discord.Guild, show_tracking: bool, descripti
             tracking_str: list = ["▬"] * min(10, max(6, len(current.title) - 6))
             tracking_str[floor(len(tracking_str) * current.audio.ratio())] = \
                 strings.emoji_blue_circle if random.randint(0, 200) > 0 \
-                else str(utils.get(jukebox.bot.emojis, name=strings.get("emoji_id_nukebox")))
+                else str(get_emoji(name=strings.get("emoji_id_nukebox")))
             description = strings.get("jukebox_current_track_progress").format(
                 "".join(tracking_str),
                 format_duration(sec=current.audio.progress()),
@@ -1814,7 +1870,7 @@ def get_empty_queue_embed(guild: discord.Guild, description: Optional[str] = Non
     :param guild: Discord server to use for role checks.
     :param description: Description to use in place of generic text.
     """
-    emoji: discord.Emoji = utils.get(jukebox.bot.emojis, name=strings.get("emoji_id_jukebox"))
+    emoji: discord.Emoji = get_emoji(name=strings.get("emoji_id_jukebox"))
     embed: discord.Embed = discord.Embed(
         title=strings.get("jukebox_empty_title"),
         description=description if description else strings.get("jukebox_empty_description"),
@@ -1826,7 +1882,7 @@ def get_empty_queue_msg():
     """
     Generates a preview message for an empty queue.
     """
-    emoji: discord.Emoji = utils.get(jukebox.bot.emojis, name=strings.get("emoji_id_vinyl"))
+    emoji: discord.Emoji = get_emoji(name=strings.get("emoji_id_vinyl"))
     msg = strings.get("jukebox_empty").format(emoji)
     return msg
 
@@ -1837,7 +1893,7 @@ def get_lyrics_embed(guild: discord.Guild, song: Song) -> discord.Embed:
     url: str = song.url
 
     # Crop useless artefacts out of raw text
-    text = re.sub(r"You might also like|\d*Embed", "", text.split("Lyrics", 1)[1])
+    text = Commands.LYRICS_ARTEFACT_PATTERN.sub("", text.split("Lyrics", 1)[1])
 
     # Crop text to fit character limit
     limit_chars: int = config.LYRICS_CHARACTER_LIMIT
@@ -1851,10 +1907,10 @@ def get_lyrics_embed(guild: discord.Guild, song: Song) -> discord.Embed:
         else text_limited
 
     # Italicise context tags
-    text = re.sub(pattern=r"\[.+\]", repl=lambda match: f"*{match.group()}*", string=text)
+    text = Commands.LYRICS_TAG_PATTERN.sub(repl=lambda match: f"*{match.group()}*", string=text)
 
     # Create embed
-    emoji: discord.Emoji = utils.get(Commands.bot.emojis, name=strings.get("emoji_id_vinyl"))
+    emoji: discord.Emoji = get_emoji(name=strings.get("emoji_id_vinyl"))
     embed: discord.Embed = discord.Embed(
         title=title,
         description=text,
@@ -1903,10 +1959,25 @@ def format_duration(sec: int, is_playlist: bool = False) -> str:
     """
     Formats a duration in seconds for playlists and playlist items.
     """
-    return datetime.utcfromtimestamp(sec) \
-        .strftime(strings.get("datetime_format_playlist")
-                  if is_playlist
-                  else strings.get("datetime_format_track"))
+    return _format_duration(
+        sec,
+        strings.get("datetime_format_playlist")
+        if is_playlist
+        else strings.get("datetime_format_track"))
+
+@functools.lru_cache(maxsize=4096)
+def _format_duration(sec: int, fmt: str) -> str:
+    """
+    Formats a duration in seconds with a given format.
+    Results are keyed by format as well as duration, so reloaded strings take effect immediately.
+    """
+    return datetime.utcfromtimestamp(sec).strftime(fmt)
+
+def format_user(user: discord.User) -> str:
+    """
+    Formats a user's name, discriminator, and ID for console logs.
+    """
+    return f"{user.name}#{user.discriminator} ({user.id})"
 
 def format_user_playtime(sec: int) -> str:
     """
@@ -1921,12 +1992,42 @@ def format_user_playtime(sec: int) -> str:
         int(mins / 60)
     )
 
+@functools.lru_cache(maxsize=None)
 def get_genius() -> Genius:
+    """
+    Gets the Genius lyrics client instance, created on first use and reset when this extension is reloaded.
+    """
     genius: Genius = Genius(config.TOKEN_LYRICS)
     genius.timeout = config.LYRICS_SEARCH_TIMEOUT
     genius.verbose = config.LYRICS_VERBOSE
     return genius
 
+@functools.lru_cache(maxsize=None)
+def get_config_bytes() -> bytes:
+    """
+    Gets the contents of the config file with all tokens removed, read on first use and reset when this extension is
+    reloaded.
+    """
+    with open(file=config.CONFIG_PATH, mode="r", encoding="utf8") as file:
+        js: dict = json.load(file)
+    js.pop("tokens")
+    return json.dumps(js, indent=2, sort_keys=False).encode("utf8")
+
+_pins: Optional[Tuple[float, List[str]]] = None
+"""Pinned message contents, along with the modified time of the pins data file they were read from."""
+
+
+def get_pins() -> List[str]:
+    """
+    Gets the contents of pinned messages from the pins data file, read again only once the file is modified.
+    """
+    global _pins
+    mtime: float = os.stat(config.PINS_PATH).st_mtime
+    if _pins is None or _pins[0] != mtime:
+        with open(file=config.PINS_PATH, mode="r", encoding="utf8") as file:
+            _pins = (mtime, json.load(file).get("messages"))
+    return _pins[1]
+
 
 # Discord.py boilerplate
 
@@ -1935,8 +2036,10 @@ async def setup(bot: commands.Bot) -> None:
     cog: Commands = Commands()
     Commands.bot = cog.bot = bot
     await bot.add_cog(cog)
-    bot.add_listener(Vote.on_reaction_add)
+    bot.add_listener(Vote.on_raw_reaction_add)
+    bot.add_listener(Vote.on_raw_reaction_remove)
     bot.add_listener(Commands.on_voice_state_update)
+    bot.add_listener(Commands.on_guild_emojis_update)
     jukebox.on_track_start_func = cog.before_play
     jukebox.on_track_end_func = cog.after_play
     bot.reload_strings()
@@ -5,6 +5,8 @@
 
 """
 Contents:
+    TrackingAudio
+    TimedCache
     YTDLSource
     JukeboxItem
     Jukebox
@@ -17,13 +19,21 @@ Contents:
 """
 
 import asyncio
+import concurrent.futures
+import copy
+import functools
 import io
 import logging
 import os
 import shutil
+import socket
+import threading
+import time
 from asyncio import AbstractEventLoop
+from collections import deque, OrderedDict
+from itertools import chain, islice
 from sys import platform
-from typing import List, Optional, Union
+from typing import Any, Deque, Hashable, List, Optional, Union
 
 import discord
 import random
@@ -77,6 +87,47 @@ class TrackingAudio(FFmpegPCMAudio):
         return (self.progress() / self.duration()) if self._sec_total > 0 else 0
 
 
+class TimedCache:
+    """
+    Least-recently-used cache with entries expiring after a given duration.
+    :param max_size: Maximum number of entries, evicting the least-recently-used entry once exceeded.
+    :param ttl_seconds: Duration in seconds before entries expire.
+    """
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        self._entries: OrderedDict = OrderedDict()
+        self.max_size: int = max_size
+        self.ttl_seconds: float = ttl_seconds
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Gets the value for a given key, or None if missing or expired.
+        """
+        entry: Optional[tuple] = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Sets the value for a given key, evicting the least-recently-used entry if full.
+        """
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Removes all entries.
+        """
+        self._entries.clear()
+
+
 class YTDLSource(discord.PCMVolumeTransformer):
     """
     Audio transform override for handling YTDLP connections.
@@ -91,97 +142,195 @@ class YTDLSource(discord.PCMVolumeTransformer):
         """
         log_msg: str = strings.get("log_console_media_query").format(query)
         if config.LOGGING_CONSOLE:
-            print(log_msg)
+            logging.getLogger("jukebox").info(log_msg)
         if config.LOGGING_FILE:
             logging.getLogger("discord").debug(log_msg)
 
         loop = loop or asyncio.get_event_loop()
 
+        # Reuse results for recently-extracted queries, copied as entries are modified once processed
+        query = query.strip()
+        cache_key: tuple = (ambiguous, query.lower() if ambiguous else query)
+        cached: Optional[Any] = _extraction_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
         # Process and download track metadata where available
         entries: List[dict] = []
         title: Optional[str] = None
         source: Optional[str] = None
         num_failed: int = 0
 
-        ytdlconn.params["max_downloads"] = None if not ambiguous else config.YTDL_AMBIGUOUS_RESULTS
+        # Playlist items are only listed here, and are processed and downloaded later with get_playlist_files
         response: Optional[dict] = await loop.run_in_executor(
-            executor=None,
-            func=lambda: ytdlconn.extract_info(
+            executor=_ytdl_executor,
+            func=lambda: (get_ytdl() if ambiguous else get_ytdl_flat()).extract_info(
                 url=query if not ambiguous else f"ytsearch{config.YTDL_AMBIGUOUS_ATTEMPTS}:{query}",
-                download=not ambiguous and not config.PLAYLIST_STREAMING))
+                download=False))
 
         if response:
             # Fetch all playlist items as an iterable if they exist, else wrap single item as an iterable
-            entries = response.get("entries") if "entries" in response else [response]
+            response_entries: Optional[List[dict]] = response.get("entries")
+            if response_entries is None:
+                response_entries = [response]
 
             # Fetch relevant fields from response and trim out failed downloads from the playlist
-            num_listed: int = len(entries)
-            entries = [entry for entry in entries if entry]
+            entries = [entry for entry in response_entries if entry]
+            num_failed = len(response_entries) - len(entries)
 
             if ambiguous:
+                # Results are trimmed here rather than with max_downloads, as YTDL counts downloads over the lifetime
+                # of the shared instance and would later refuse to download queued tracks
+                entries = entries[:config.YTDL_AMBIGUOUS_RESULTS]
+                if entries:
+                    _extraction_cache.set(cache_key, copy.deepcopy(entries))
                 return entries
 
-            title = response.get("title") if "title" in response else None
-            source = response.get("url") if "url" in response else entries[0].get("url") if any(entries) else None
-            num_failed = num_listed - len(entries)
+            # Unprocessed playlist items are tagged with their extractor to allow for checks before processing
+            extractor: str = response.get("extractor", "")
+            for entry in entries:
+                if "extractor" not in entry:
+                    entry["extractor"] = (entry.get("ie_key") or extractor).lower()
+
+            title = response.get("title")
+            source = response.get("url")
+            if source is None and entries:
+                source = entries[0].get("url")
 
             log_msg: str = strings.get("log_console_media_response").format(source)
             if config.LOGGING_CONSOLE:
-                print(log_msg)
+                logging.getLogger("jukebox").info(log_msg)
             if config.LOGGING_FILE:
                 logging.getLogger("discord").debug(log_msg)
 
+            if entries:
+                _extraction_cache.set(cache_key, copy.deepcopy((entries, title, source, num_failed)))
+
         return entries, title, source, num_failed
 
     @classmethod
-    async def get_playlist_files(cls, playlist_info, is_streaming: bool, added_by: discord.member) -> List["JukeboxItem"]:
+    async def get_playlist_files(cls, playlist_info, is_streaming: bool, added_by: discord.member,
+                                 *, loop: AbstractEventLoop = None) -> List["JukeboxItem"]:
         """
-        Fetch the audio data for all items in a playlist.
+        Fetch the audio data for the first item in a playlist, leaving all other items to be processed before playback.
+        The first item is omitted if it fails to process or exceeds the duration limit.
         :param playlist_info: List of metadata for items in a playlist.
         :param is_streaming: Whether media is streaming from external sources, rather than preloading to the local drive.
         :param added_by: Discord user instance to attach to each track for later reference.
+        :param loop: Bot async event loop.
         """
-        playlist_items: List[JukeboxItem] = []
-        for entry in playlist_info:
-            # Process and download the track audio
-            source = entry.get("url") if is_streaming else ytdlconn.prepare_filename(entry)
-            # Add tracks as jukebox queue items
-            playlist_items.append(YTDLSource.entry_to_track(entry=entry, source=source, added_by=added_by))
+        # Add tracks as jukebox queue items
+        playlist_items: List[JukeboxItem] = [
+            YTDLSource.entry_to_track(entry=entry, source=None, added_by=added_by)
+            for entry in playlist_info]
+
+        if playlist_items:
+            # Process and download the first track audio so it's ready to play
+            try:
+                await playlist_items[0].ensure_extracted(is_streaming=is_streaming, loop=loop)
+            except yt_dlp.DownloadError as error:
+                err.log(error)
+                playlist_items.pop(0)
         return playlist_items
 
     @classmethod
-    def entry_to_track(cls, entry: dict, source: str, added_by: discord.member):
+    async def process_entry(cls, entry: dict, is_streaming: bool, *, loop: AbstractEventLoop = None) -> dict:
+        """
+        Fetch the media metadata and source URL for an item in a playlist, downloading the audio if not streaming.
+        :param entry: Metadata for an item in a playlist, as listed by get_playlist_info.
+        :param is_streaming: Whether media is streaming from external sources, rather than preloading to the local drive.
+        :param loop: Bot async event loop.
+        :raises yt_dlp.DownloadError: If the item failed to process or exceeds the duration limit.
+        """
+        # Reuse results for recently-downloaded items while their files remain, as streaming URLs are left to expire
+        cache_key: Optional[str] = entry.get("webpage_url") or entry.get("url")
+        if not is_streaming and cache_key:
+            cached: Optional[dict] = _processed_cache.get(cache_key)
+            if cached is not None and os.path.exists(get_ytdl().prepare_filename(cached)):
+                return copy.deepcopy(cached)
+
+        loop = loop or asyncio.get_event_loop()
+        info: Optional[dict] = await loop.run_in_executor(
+            executor=_ytdl_executor,
+            func=lambda: get_ytdl().process_ie_result(ie_result=entry, download=not is_streaming))
+        reason: Optional[str] = filter_func(info, incomplete=False) if info else strings.get("error_track")
+        if reason:
+            raise yt_dlp.DownloadError(reason)
+        if not is_streaming and cache_key:
+            _processed_cache.set(cache_key, copy.deepcopy(info))
+        return info
+
+    @classmethod
+    def entry_to_track(cls, entry: dict, source: Optional[str], added_by: discord.member):
         return JukeboxItem(
                 source=source,
                 title=entry.get("title"),
-                url=entry.get("webpage_url"),
-                duration=int(entry.get("duration")),
+                url=entry.get("webpage_url") or entry.get("url"),
+                duration=int(entry.get("duration") or 0),
                 thumbnail=entry.get("thumbnail"),
-                added_by=added_by)
+                added_by=added_by,
+                entry=entry if not source else None)
 
 
 class JukeboxItem:
     """
     Item representing a track in the queue, containing basic media metadata, source URL, and audio data once playing.
+    Tracks without a source URL are processed with ensure_extracted before playback.
     """
-    def __init__(self, source: str, title: str, url: str, duration: int, thumbnail: str, added_by: discord.member) -> None:
-        self.source: str = source
+    __slots__ = ("source", "title", "url", "duration", "added_by", "thumbnail", "audio", "entry", "_extraction", "_audio_lock")
+
+    def __init__(self, source: Optional[str], title: str, url: str, duration: int, thumbnail: str, added_by: discord.member,
+                 entry: Optional[dict] = None) -> None:
+        self.source: Optional[str] = source
         self.title: str = title
         self.url: str = url
         self.duration: int = duration
         self.added_by: discord.User = added_by
         self.thumbnail: str = thumbnail
         self.audio: Optional[TrackingAudio] = None
+        self.entry: Optional[dict] = entry
+        self._extraction: Optional[asyncio.Task] = None
+        self._audio_lock: threading.Lock = threading.Lock()
 
     def audio_from_source(self) -> TrackingAudio:
         """
         Fetch audio data from self source URL.
+        Sources are opened at most once, as tracks may be played while their source is being prefetched.
         """
-        if not self.audio:
-            self.audio = TrackingAudio(
-                source=self.source,
-                duration_seconds=self.duration)
-        return self.audio
+        with self._audio_lock:
+            if not self.audio:
+                self.audio = TrackingAudio(
+                    source=self.source,
+                    duration_seconds=self.duration)
+            return self.audio
+
+    async def ensure_extracted(self, is_streaming: bool = None, *, loop: AbstractEventLoop = None) -> None:
+        """
+        Fetch media metadata and source URL for this track if not yet processed, downloading the audio if not streaming.
+        :param is_streaming: Whether media is streaming from external sources, defaulting to the configured behaviour.
+        :param loop: Bot async event loop.
+        :raises yt_dlp.DownloadError: If the track failed to process or exceeds the duration limit.
+        """
+        if self.source:
+            return
+
+        is_streaming = is_streaming if is_streaming is not None else config.PLAYLIST_STREAMING
+        loop = loop or asyncio.get_event_loop()
+        if not self._extraction:
+            # Share a single processing task between any concurrent callers
+            self._extraction = loop.create_task(YTDLSource.process_entry(
+                entry=self.entry,
+                is_streaming=is_streaming,
+                loop=loop))
+        info: dict = await self._extraction
+
+        if not self.source:
+            self.source = info.get("url") if is_streaming else get_ytdl().prepare_filename(info)
+            self.title = info.get("title") or self.title
+            self.url = info.get("webpage_url") or self.url
+            self.duration = int(info.get("duration") or self.duration)
+            self.thumbnail = info.get("thumbnail")
+            self.entry = None
 
 
 class Jukebox:
@@ -190,13 +339,13 @@ class Jukebox:
     """
 
     def __init__(self) -> None:
-        _clear_temp_folders()
-        self._multiqueue: List[List[JukeboxItem]] = []
+        self._multiqueue: Deque[Deque[JukeboxItem]] = deque()
         self.bot: commands.Bot = None
         self.voice_client: Optional[discord.VoiceClient] = None
         self.is_looping: bool = False
         self.on_track_start_func = None
         self.on_track_end_func = None
+        self._prefetched: Optional[JukeboxItem] = None
         # Windows will load Opus automatically. Linux needs to be manually told.
         if platform.startswith('linux'):
             discord.opus.load_opus('libopus.so.0')
@@ -207,11 +356,11 @@ class Jukebox:
         """
         Fetch all tracks in the queue, flattened into a single list in column-major order with multiqueue enabled.
         """
-        return sum(self._multiqueue, []) if config.PLAYLIST_MULTIQUEUE \
-            else self.current_queue() if any(self._multiqueue) \
+        return list(chain.from_iterable(self._multiqueue)) if config.PLAYLIST_MULTIQUEUE \
+            else list(self.current_queue()) if any(self._multiqueue) \
             else []
 
-    def get_queue(self, user_id: int = None) -> List[JukeboxItem]:
+    def get_queue(self, user_id: int = None) -> Deque[JukeboxItem]:
         """
         Fetch the queue containing a given user's tracks.
         With multiqueue enabled, this queue will exclusively contain tracks from this user, if any, in order of insertion.
@@ -219,7 +368,7 @@ class Jukebox:
         :param user_id: Discord unique ID of a user to compare against the submitter of tracks in a queue.
         """
         if not any(self._multiqueue):
-            return []
+            return deque()
 
         if not config.PLAYLIST_MULTIQUEUE:
             # Return the base queue
@@ -228,11 +377,11 @@ class Jukebox:
         if user_id:
             # For multiqueue, fetch matching queue for a given user
             for queue in self._multiqueue:
-                if any(queue) and queue[0].added_by.id == user_id:
+                if queue and queue[0].added_by.id == user_id:
                     return queue
 
         # Return matching queue in multiqueue if one exists
-        return self.current_queue() if not self.is_empty() else []
+        return self.current_queue() if not self.is_empty() else deque()
 
     def get_range(self, index_start: int, index_end: int) -> List[JukeboxItem]:
         """
@@ -240,11 +389,11 @@ class Jukebox:
         """
         if not config.PLAYLIST_MULTIQUEUE:
             # Return items from a range in the queue
-            queue: List[JukeboxItem] = self.get_queue()
+            queue: Deque[JukeboxItem] = self.get_queue()
             # Clamp to range of elements in queue
             index_start: int = max(0, index_start)
             index_end: int = min(len(queue), index_end)
-            return queue[index_start:index_end]
+            return list(islice(queue, index_start, index_end))
 
         # For multiqueue, fetch items in row-major traversal (one item per queue per iter) of queues
         items: List[JukeboxItem] = []
@@ -270,12 +419,12 @@ class Jukebox:
         Fetch an item in the queue by its user-facing (row-major) index.
         :param index: Queue index to fetch item at.
         """
-        if self.is_empty() or index < 0 or index >= len(self.get_all()):
+        if self.is_empty() or index < 0 or index >= self.num_tracks():
             return None
 
         if not config.PLAYLIST_MULTIQUEUE:
             # Return item by index in the queue
-            return self.current_queue()[index] if any(self._multiqueue) and 0 <= index < len(self._multiqueue) else None
+            return self.current_queue()[index] if any(self._multiqueue) and 0 <= index < len(self.current_queue()) else None
 
         # For multiqueue, return item by index in row-major traversal (one item per queue per iter) of queues
         x_max: int = len(self._multiqueue)
@@ -315,24 +464,45 @@ class Jukebox:
 
         return -1
 
-    def append(self, item: JukeboxItem) -> None:
+    def append(self, item: JukeboxItem) -> int:
         """
         Add a track to the tail of the queue.
+        :return: User-facing (row-major) index of the track in the queue, saving a search with get_index_of_item.
         """
+        queue: Deque[JukeboxItem]
         if config.PLAYLIST_MULTIQUEUE:
-            if not any(any(queue) and queue[0].added_by == item.added_by for queue in self._multiqueue):
+            if not any(queue and queue[0].added_by == item.added_by for queue in self._multiqueue):
                 # Create queue for user in multiqueue if none exists
-                self._multiqueue.append([item])
+                queue = deque([item])
+                self._multiqueue.append(queue)
             else:
                 # Append to existing user queue
-                self.get_queue(item.added_by.id).append(item)
+                queue = self.get_queue(item.added_by.id)
+                queue.append(item)
         else:
-            if not any(self._multiqueue) or not any(self._multiqueue[0]):
+            if not any(self._multiqueue) or not self._multiqueue[0]:
                 # For multiqueue, create queue if none exists
-                self._multiqueue.append([item])
+                queue = deque([item])
+                self._multiqueue.append(queue)
             else:
                 # Append to existing queue in multiqueue
-                self.get_queue(item.added_by.id).append(item)
+                queue = self.get_queue(item.added_by.id)
+                queue.append(item)
+        self._update_prefetch()
+
+        y: int = len(queue) - 1
+        if not config.PLAYLIST_MULTIQUEUE:
+            return y
+
+        # For multiqueue, count items in all prior rows, and in the same row of all prior queues
+        index: int = 0
+        is_prior: bool = True
+        for other in self._multiqueue:
+            if other is queue:
+                is_prior = False
+            else:
+                index += min(len(other), y + 1 if is_prior else y)
+        return index
 
     def remove(self, track: JukeboxItem, is_deleting: bool, is_after_play: bool = False) -> None:
         """
@@ -341,28 +511,35 @@ class Jukebox:
         :param is_deleting: Whether to delete associated files if not streaming.
         :param is_after_play: Whether the track is being removed from the current track after-play method.
         """
-        if not is_after_play and self.voice_client and self.voice_client.source is track.audio:
+        if not is_after_play and track.audio and self.voice_client and self.voice_client.source is track.audio:
             # Stop currently-playing track before removal, invoking after-play behaviour which calls this method itself
             self.stop()
         else:
             log_msg: str = strings.get("log_console_media_removed").format(track.title)
             if config.LOGGING_CONSOLE:
-                print(log_msg)
+                logging.getLogger("jukebox").info(log_msg)
             if config.LOGGING_FILE:
                 logging.getLogger("discord").debug(log_msg)
 
             # Remove track from queue
-            queue: List[JukeboxItem] = self.get_queue(track.added_by.id)
+            queue: Deque[JukeboxItem] = self.get_queue(track.added_by.id)
             queue.remove(track)
-            if config.PLAYLIST_MULTIQUEUE and not any(queue):
+            if config.PLAYLIST_MULTIQUEUE and not queue:
                 self._multiqueue.remove(queue)
 
+            # Release any audio source opened for this track, including prefetched sources that were never played
+            if track.audio:
+                track.audio.cleanup()
+                track.audio = None
+            if not is_after_play:
+                self._update_prefetch()
+
             # Remove downloaded audio file from disk
-            try:
-                if is_deleting and not config.PLAYLIST_STREAMING:
+            if is_deleting and not config.PLAYLIST_STREAMING and track.source:
+                try:
                     os.remove(track.source)
-            except FileNotFoundError as error:
-                err.log(error)
+                except FileNotFoundError as error:
+                    err.log(error)
 
     def play(self) -> None:
         """
@@ -371,9 +548,16 @@ class Jukebox:
         # Play or resume the jukebox queue
         current: JukeboxItem = self.current_track()
         if current and self.voice_client and not self.voice_client.is_playing():
+            if not current.source:
+                # Process the current track before playing if it wasn't prefetched
+                if self.bot:
+                    future = asyncio.run_coroutine_threadsafe(self._extract_and_play(current), self.bot.loop)
+                    future.add_done_callback(_log_future_error)
+                return
+
             log_msg: str = strings.get("log_console_media_start").format(current.title)
             if config.LOGGING_CONSOLE:
-                print(log_msg)
+                logging.getLogger("jukebox").info(log_msg)
             if config.LOGGING_FILE:
                 logging.getLogger("discord").debug(log_msg)
 
@@ -405,16 +589,22 @@ class Jukebox:
         if self.voice_client and self.voice_client.is_playing():
             self.voice_client.stop()
 
-    def clear(self) -> None:
+    async def clear(self) -> None:
         """
         Remove all tracks from the queue, clear all temporary files and folders, and stop playback.
+        Temporary files are cleared in the executor to avoid blocking the event loop on disk I/O.
         """
-        _clear_temp_folders()
         # Clear any and all queues in the multiqueue
         for queue in self._multiqueue:
+            for track in queue:
+                # Release prefetched audio sources, leaving the currently-playing source to be stopped
+                if track.audio and not (self.voice_client and self.voice_client.source is track.audio):
+                    track.audio.cleanup()
             queue.clear()
         self._multiqueue.clear()
+        self._prefetched = None
         self.stop()
+        await asyncio.get_event_loop().run_in_executor(executor=None, func=_clear_temp_folders)
 
     def remove_many(self, tracks: List[JukeboxItem]) -> None:
         """
@@ -429,19 +619,19 @@ class Jukebox:
         """
         Shuffles the queue, ignoring the currently-playing track.
         """
-        queue: List[JukeboxItem] = self.get_queue(user_id=user_id)
+        queue: Deque[JukeboxItem] = self.get_queue(user_id=user_id)
         if not queue:
             return -1
-        current: JukeboxItem = self.current_track()
-        is_current: bool = current and queue and current in queue
+        # The currently-playing track is always at the head of its queue
+        is_current: bool = queue[0] is self.current_track()
 
-        # Shuffle and re-append a clone of the queue, ignoring the currently-playing track if from this queue
-        queue_shuffled: List[JukeboxItem] = queue[1:] if is_current else queue[0:]
+        # Shuffle and replace all tracks after the head of the queue, leaving the currently-playing track in place
+        queue_shuffled: List[JukeboxItem] = list(islice(queue, 1 if is_current else 0, None))
         random.shuffle(queue_shuffled)
-        queue.clear()
-        if is_current:
-            queue.append(current)
-        [queue.append(item) for item in queue_shuffled]
+        for _ in range(len(queue_shuffled)):
+            queue.pop()
+        queue.extend(queue_shuffled)
+        self._update_prefetch()
 
         return len(queue)
 
@@ -457,7 +647,7 @@ class Jukebox:
         if not item:
             return False
         current: JukeboxItem = self.current_track()
-        queue: List[JukeboxItem] = self.get_queue(user_id=item.added_by.id)
+        queue: Deque[JukeboxItem] = self.get_queue(user_id=item.added_by.id)
         is_current_in_queue: bool = current and current in queue
         if len(queue) <= 1:
             # Ignore if the track will not be moved when re-inserted
@@ -466,6 +656,7 @@ class Jukebox:
             # Pop the selected track and replace it at the head of the queue if it's not the queue head
             queue.remove(item)
             queue.insert(0 if not is_current_in_queue else 1, item)
+            self._update_prefetch()
         return True
 
     def loop(self) -> bool:
@@ -482,9 +673,80 @@ class Jukebox:
         Behaviour run once the current track has begun playback.
         """
         current: JukeboxItem = self.current_track()
-        if self.on_track_start_func:
-            # Run bot funcs
-            self.on_track_start_func(current)
+        if self.on_track_start_func and self.bot:
+            # Run async bot funcs without waiting on their results
+            future = asyncio.run_coroutine_threadsafe(self.on_track_start_func(current), self.bot.loop)
+            future.add_done_callback(_log_future_error)
+
+        # Prepare the next track while the current track is playing
+        self._prefetch(self.get_item_by_index(index=1))
+
+    def _prefetch(self, track: Optional[JukeboxItem]) -> None:
+        """
+        Notes a track as the next to be played, and opens its audio source ahead of playback.
+        """
+        self._prefetched = track
+        if track and self.bot:
+            future = asyncio.run_coroutine_threadsafe(self._prefetch_audio(track), self.bot.loop)
+            future.add_done_callback(_log_future_error)
+
+    async def _prefetch_audio(self, track: JukeboxItem) -> None:
+        """
+        Opens the audio source for a track ahead of playback, avoiding FFMPEG startup between tracks.
+        """
+        if track.audio:
+            return
+        try:
+            await track.ensure_extracted(loop=self.bot.loop)
+        except yt_dlp.DownloadError as error:
+            # Failed tracks are handled when played
+            err.log(error)
+            return
+        await self.bot.loop.run_in_executor(
+            executor=None,
+            func=track.audio_from_source)
+        # Release the source if the track was moved or removed while it was being opened
+        if self._prefetched is not track:
+            self._release_audio(track)
+
+    def _update_prefetch(self) -> None:
+        """
+        Prefetches the track next in the queue once it changes, such as after tracks are added or the queue is reordered,
+        releasing the audio source prefetched for the previous next track.
+        """
+        track: Optional[JukeboxItem] = self.get_item_by_index(index=1)
+        if track is self._prefetched:
+            return
+        if self._prefetched:
+            self._release_audio(self._prefetched)
+        if self.voice_client and (self.voice_client.is_playing() or self.voice_client.is_paused()):
+            self._prefetch(track)
+        else:
+            # Tracks are prefetched once playback begins
+            self._prefetched = None
+
+    def _release_audio(self, track: JukeboxItem) -> None:
+        """
+        Releases the audio source opened for a track, unless it is the current track, as it is playing or about to be.
+        """
+        if track.audio and track is not self.current_track() \
+                and not (self.voice_client and self.voice_client.source is track.audio):
+            track.audio.cleanup()
+            track.audio = None
+
+    async def _extract_and_play(self, track: JukeboxItem) -> None:
+        """
+        Processes a track before starting playback, removing the track instead if it fails to process.
+        """
+        try:
+            await track.ensure_extracted(loop=self.bot.loop)
+        except yt_dlp.DownloadError as error:
+            err.log(error)
+            if track is self.current_track():
+                self.remove(
+                    track=track,
+                    is_deleting=True)
+        self.play()
 
     def _after_play(self, error: Exception) -> None:
         """
@@ -495,7 +757,7 @@ class Jukebox:
             err.log(error)
 
         track: JukeboxItem = self.current_track()
-        queue: List[JukeboxItem] = self.get_queue(track.added_by.id) if track else None
+        queue: Deque[JukeboxItem] = self.get_queue(track.added_by.id) if track else None
 
         if track:
             # Remove the just-played track from the queue
@@ -510,22 +772,29 @@ class Jukebox:
 
             log_msg: str = strings.get("log_console_media_end").format(track.title)
             if config.LOGGING_CONSOLE:
-                print(log_msg)
+                logging.getLogger("jukebox").info(log_msg)
             if config.LOGGING_FILE:
                 logging.getLogger("discord").debug(log_msg)
 
-        if config.PLAYLIST_MULTIQUEUE and queue and any(queue) and queue in self._multiqueue and len(self._multiqueue) > 1:
+        if config.PLAYLIST_MULTIQUEUE and queue and queue in self._multiqueue and len(self._multiqueue) > 1:
             # Move the current queue to the end of the multiqueue
-            self._multiqueue.append(self._multiqueue.pop(self._multiqueue.index(queue)))
+            if self._multiqueue[0] is queue:
+                self._multiqueue.rotate(-1)
+            else:
+                self._multiqueue.remove(queue)
+                self._multiqueue.append(queue)
 
-        # Play the next item in the queue
-        self.play()
+        # Play the next item in the queue, from the bot event loop if possible to return to the voice thread immediately
+        if self.bot:
+            self.bot.loop.call_soon_threadsafe(self.play)
+        else:
+            self.play()
 
         # Do user-facing after-play behaviour
         if self.on_track_end_func and self.bot:
-            # Run async bot funcs
+            # Run async bot funcs without waiting on their results
             future = asyncio.run_coroutine_threadsafe(self.on_track_end_func(track), self.bot.loop)
-            future.result(timeout=config.CORO_TIMEOUT)
+            future.add_done_callback(_log_future_error)
 
     # Queue utilities
 
@@ -534,10 +803,11 @@ class Jukebox:
         Gets whether either a given user or this bot is currently connected to the voice channel.
         :param member: User instance to find in the voice channel users.
         """
-        if not member:
-            return self.voice_client and self.voice_client.is_connected()
-        else:
-            return member.voice and member.voice.channel and member.voice.channel.id == config.CHANNEL_VOICE
+        if member is None:
+            voice_client: Optional[discord.VoiceClient] = self.voice_client
+            return voice_client is not None and voice_client.is_connected()
+        voice: Optional[discord.VoiceState] = member.voice
+        return voice is not None and voice.channel is not None and voice.channel.id == config.CHANNEL_VOICE
 
     def num_listeners(self) -> int:
         """
@@ -545,7 +815,7 @@ class Jukebox:
         """
         return len(self.voice_client.channel.members) - 1 if self.is_in_voice_channel() else 0
 
-    def current_queue(self) -> Optional[List[JukeboxItem]]:
+    def current_queue(self) -> Optional[Deque[JukeboxItem]]:
         """
         Gets the head queue.
         """
@@ -558,7 +828,7 @@ class Jukebox:
         """
         Gets the track at the head of the queue.
         """
-        if self.is_empty() or not any(self._multiqueue[0]):
+        if self.is_empty() or not self._multiqueue[0]:
             return None
 
         return self._multiqueue[0][0]
@@ -569,36 +839,62 @@ class Jukebox:
         """
         return sum(len(queue) for queue in self._multiqueue)
 
+    def total_duration(self) -> int:
+        """
+        Gets the total duration in seconds of all tracks in the queue.
+        """
+        return sum(track.duration for queue in self._multiqueue for track in queue)
+
     def is_empty(self) -> bool:
         """
         Gets whether the queue contains no tracks.
         """
-        return all(not any(queue) for queue in self._multiqueue)
+        return not any(self._multiqueue)
 
 
 # Utility functions
 
 
-def filter_func(info, *, incomplete) -> str:
+def filter_func(info, *, incomplete) -> Optional[str]:
     """
     Filter applied to all media being downloaded via YTDLP.
     """
-    duration: int = info.get("duration")
+    duration: Optional[int] = info.get("duration")
+    if not duration:
+        # Accept livestreams and listed playlist items with no known duration
+        return None
     if duration > config.TRACK_DURATION_LIMIT:
+        # Message is only fetched for rejected media so as to respect reloaded strings
         return strings.get("info_duration_exceeded").format(
             duration,
             config.TRACK_DURATION_LIMIT)
 
 
+def _log_future_error(future: concurrent.futures.Future) -> None:
+    """
+    Logs any exception raised by a coroutine scheduled without waiting on its result.
+    """
+    if not future.cancelled() and future.exception():
+        err.log(future.exception())
+
+
 def _clear_temp_folders() -> None:
     """
     Clear all temporary files and folders, removing any cached or preloaded media, and restoring the empty folders.
     """
     try:
         fp: str = config.TEMP_DIR
-        if os.path.exists(fp):
-            shutil.rmtree(fp)
-        os.mkdir(fp)
+        os.makedirs(fp, exist_ok=True)
+        # Remove the folder contents, keeping the folder itself
+        with os.scandir(fp) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.unlink(entry.path)
+                except FileNotFoundError:
+                    pass
     except Exception as error:
         err.log(error)
 
@@ -606,9 +902,70 @@ def _clear_temp_folders() -> None:
 # YTDL config
 
 
-config.YTDL_OPTIONS["match_filter"] = filter_func
-ytdlconn: yt_dlp.YoutubeDL = yt_dlp.YoutubeDL(config.YTDL_OPTIONS)
-"""YoutubeDL connection instance."""
+_extraction_cache: TimedCache = TimedCache(
+    max_size=config.YTDL_CACHE_SIZE,
+    ttl_seconds=config.YTDL_CACHE_TTL_SECONDS)
+"""Recent query results from get_playlist_info, used to skip repeated extractions."""
+_processed_cache: TimedCache = TimedCache(
+    max_size=config.YTDL_CACHE_SIZE,
+    ttl_seconds=config.YTDL_CACHE_TTL_SECONDS)
+"""Recent downloaded items from process_entry, used to skip repeated processing while their files remain."""
+_ytdl_thread: threading.local = threading.local()
+"""Thread-local state marking threads owned by the YTDL executor."""
+_ytdl_executor: concurrent.futures.ThreadPoolExecutor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=config.YTDL_WORKERS,
+    thread_name_prefix="ytdl",
+    initializer=lambda: setattr(_ytdl_thread, "is_ytdl", True))
+"""Executor reserved for YTDL extractions and downloads, kept apart from other blocking work in the default executor."""
+
+
+@functools.lru_cache(maxsize=None)
+def _install_dns_cache() -> None:
+    """
+    Replaces socket.getaddrinfo with a version caching recent lookups, as YTDL resolves the same hosts many times per
+    extraction without reusing connections. Failed lookups are not cached.
+    The replacement is process-wide, but only lookups made from YTDL executor threads are cached, leaving Discord
+    gateway and voice connections to resolve hosts as usual.
+    """
+    if not config.YTDL_DNS_CACHE_TTL_SECONDS:
+        return
+
+    getaddrinfo = socket.getaddrinfo
+    cache: TimedCache = TimedCache(
+        max_size=config.YTDL_DNS_CACHE_SIZE,
+        ttl_seconds=config.YTDL_DNS_CACHE_TTL_SECONDS)
+    lock: threading.Lock = threading.Lock()
+
+    @functools.wraps(getaddrinfo)
+    def getaddrinfo_cached(host, port, family=0, type=0, proto=0, flags=0) -> list:
+        if not getattr(_ytdl_thread, "is_ytdl", False):
+            return getaddrinfo(host, port, family, type, proto, flags)
+        key: tuple = (host, port, family, type, proto, flags)
+        with lock:
+            result: Optional[list] = cache.get(key)
+        if result is None:
+            result = getaddrinfo(host, port, family, type, proto, flags)
+            with lock:
+                cache.set(key, result)
+        return list(result)
+
+    socket.getaddrinfo = getaddrinfo_cached
+
+@functools.lru_cache(maxsize=None)
+def get_ytdl() -> yt_dlp.YoutubeDL:
+    """
+    Gets the YoutubeDL connection instance, created on first use.
+    """
+    _install_dns_cache()
+    return yt_dlp.YoutubeDL({**config.YTDL_OPTIONS, "match_filter": filter_func})
+
+@functools.lru_cache(maxsize=None)
+def get_ytdl_flat() -> yt_dlp.YoutubeDL:
+    """
+    Gets the YoutubeDL connection instance used to list playlist items without processing them, created on first use.
+    """
+    _install_dns_cache()
+    return yt_dlp.YoutubeDL({**config.YTDL_OPTIONS, "match_filter": filter_func, "extract_flat": "in_playlist"})
 
 
 # Init
@@ -20,11 +20,14 @@ Contents:
 """
 
 import asyncio
+import atexit
 import logging
 import os
+import queue
 import shutil
-from datetime import datetime
-from logging.handlers import RotatingFileHandler
+import sys
+from datetime import datetime, timezone
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from importlib import reload
 from typing import Optional
 
@@ -73,6 +76,16 @@ if config.LOGGING_FILE:
     handler.setFormatter(formatter)
     logger.addHandler(handler)
     logger.setLevel(logging.DEBUG)
+if config.LOGGING_CONSOLE:
+    # Console logs are written from a listener thread to avoid blocking the voice thread on stdout
+    console_logger: logging.Logger = logging.getLogger("jukebox")
+    console_queue: queue.Queue = queue.Queue(-1)
+    console_listener: QueueListener = QueueListener(console_queue, logging.StreamHandler(stream=sys.stdout))
+    console_logger.addHandler(QueueHandler(console_queue))
+    console_logger.setLevel(logging.INFO)
+    console_logger.propagate = False
+    console_listener.start()
+    atexit.register(console_listener.stop)
 
 
 # Bot definition
@@ -122,7 +135,7 @@ class MusicBot(Bot):
             allowed_mentions=discord.AllowedMentions.none())
         self.help_command = self.MusicHelpCommand()
         self.db = db
-        self.start_time = datetime.utcnow()
+        self.start_time = datetime.now(timezone.utc)
 
     # Bot events
 
@@ -131,11 +144,21 @@ class MusicBot(Bot):
         Inherited from Client. Called once internally after login. Used to load all initial command extensions.
         """
         # Load database
-        db.setup()
+        await db.setup()
+        db.start_writer()
+        # Clear any media left over from previous sessions
+        await jukebox.clear()
         # Load required extensions
         await self.load_extension(name=jukebox_commands.__name__)
         jukebox.bot = self
 
+    async def close(self) -> None:
+        """
+        Inherited from Client. Called when shutting down. Used to write any pending user stats before closing.
+        """
+        await db.flush()
+        await super().close()
+
     async def on_ready(self) -> None:
         """
         Inherited from Client. Called once internally after all setup. Used only to log notice.